@@ -1,7 +1,8 @@
-import time
+import asyncio
+import secrets
 
 from fastapi import APIRouter, BackgroundTasks, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.exceptions.exception import BusinessException
 from app.http.auth import service
@@ -14,18 +15,18 @@ from libs import cache, strings
 router = APIRouter(prefix="/auth")
 
 
-def send_code_logic(email: str, code: str) -> None:
-    """发送验证码邮件（实际场景替换为真实邮件服务）"""
-    # 模拟发送延迟（真实场景为邮件API调用耗时）
-    time.sleep(1)
+async def send_code_logic(email: str, code: str) -> None:
+    """发送验证码邮件（实际场景替换为真实邮件服务，如 aiosmtplib）"""
+    # 模拟发送延迟（真实场景为邮件API调用耗时），异步等待不占用线程池
+    await asyncio.sleep(1)
     print(f"【验证码邮件】向 {email} 发送成功，验证码：{code}（5分钟内有效）")
 
 
 @router.post("/send/code")
 async def sendCode(request: SendCodeRequest, background_tasks: BackgroundTasks):
     code = strings.random_string()
-    cache.set(request.email, code, 300)
-    background_tasks.add_task(func=send_code_logic, email=request.email, code=code)
+    await cache.aset(request.email, code, 300)
+    background_tasks.add_task(send_code_logic, email=request.email, code=code)
     return JSONSuccess(
         data={"email": request.email, "expire_seconds": 300},
         message="验证码已发送，请注意查收",
@@ -34,24 +35,24 @@ async def sendCode(request: SendCodeRequest, background_tasks: BackgroundTasks):
 
 @router.post("/verify/code")
 async def verifyCode(request: VerifyCodeRequest):
-    try:
-        key = request.email
-        stored_code = cache.get(key)
-        if not stored_code:
-            raise BusinessException(message="验证码不存在或已过期，请重新获取")
-        if request.code != stored_code:
-            raise BusinessException(message="验证码不正确，请重新输入")
-        cache.delete(key)
-        return JSONSuccess(
-            data={"email": request.email, "verified": True}, message="验证码验证通过"
-        )
-    except Exception as e:
-        raise BusinessException(
-            message=f"验证码验证失败：{str(e)}",
-        )
+    stored_code = await cache.aget(request.email)
+    if not stored_code:
+        raise BusinessException(message="验证码不存在或已过期，请重新获取")
+    # Redis 缓存未开启 decode_responses 时返回字节，统一按字节做恒定时间比较
+    if isinstance(stored_code, str):
+        stored_code = stored_code.encode()
+    if not secrets.compare_digest(request.code.encode(), stored_code):
+        raise BusinessException(message="验证码不正确，请重新输入")
+    # 验证通过后才删除，输错时仍可在有效期内重试；
+    # 以删除成功作为核销凭据，并发提交同一验证码时只有一个请求通过
+    if not await cache.adelete(request.email):
+        raise BusinessException(message="验证码不存在或已过期，请重新获取")
+    return JSONSuccess(
+        data={"email": request.email, "verified": True}, message="验证码验证通过"
+    )
 
 
 @router.post("/login")
-async def login(request: LoginRequest, db: Session = Depends(depts.get_db)):
-    response = service.loginToken(request.email, request.password, db)
+async def login(request: LoginRequest, db: AsyncSession = Depends(depts.get_db)):
+    response = await service.loginToken(request.email, request.password, db)
     return JSONSuccess(data=response)
@@ -10,9 +10,9 @@ class LoginRequest(BaseModel):
     """
 
     # 邮箱字段，必填项，无默认值，示例值为"admin@example.com"
-    email: str = Field(..., example="admin@example.com")
+    email: str = Field(..., examples=["admin@example.com"])
     # 密码字段，必填项，无默认值，示例值为"123456"
-    password: str = Field(..., example="123456")
+    password: str = Field(..., examples=["123456"])
 
 
 class TokenResponse(BaseModel):
@@ -35,7 +35,7 @@ class SendCodeRequest(BaseModel):
 
     email: EmailStr = Field(
         ...,
-        example="user@example.com",
+        examples=["user@example.com"],
         description="接收验证码的邮箱地址（需符合标准格式）",
     )
 
@@ -44,6 +44,6 @@ class VerifyCodeRequest(BaseModel):
     """验证验证码请求模型"""
 
     email: EmailStr = Field(
-        ..., example="user@example.com", description="接收验证码的邮箱地址"
+        ..., examples=["user@example.com"], description="接收验证码的邮箱地址"
     )
-    code: str = Field(..., example="123456", description="验证码")
+    code: str = Field(..., examples=["123456"], description="验证码")
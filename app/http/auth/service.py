@@ -1,14 +1,58 @@
+import hashlib
+import hmac
 from datetime import timedelta
 
-from sqlalchemy.orm import Session
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import bindparam
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
 from app.exceptions.exception import AuthenticationError
 from app.http.auth.schemas import TokenResponse
 from app.models.user import User
+from config import setting
 from libs import crypto
+from libs.cache import MemoryCache
 
+# 密码校验结果缓存：短时间内的重复登录无需再次执行 bcrypt 校验
+_verify_cache = MemoryCache(max_size=2048)
+VERIFY_CACHE_TTL = 5
+# 校验失败的结果只缓存 1 秒，避免影响限流等依赖失败次数的逻辑
+VERIFY_FAILED_CACHE_TTL = 1
 
-def loginToken(email: str, password: str, db: Session) -> TokenResponse:
+# token 有效期（3 小时）
+TOKEN_EXPIRES_DELTA = timedelta(hours=3)
+TOKEN_EXPIRES_IN = int(TOKEN_EXPIRES_DELTA.total_seconds())
+
+# 按邮箱查询未删除用户的语句，模块加载时构建一次，SQL 编译结果由 SQLAlchemy 缓存复用
+# 登录只需要 id/password/state，其余列不加载
+_user_by_email = (
+    User.undelete()
+    .options(load_only(User.id, User.password, User.state))
+    .where(User.email == bindparam("email"))
+)
+
+
+def _verify_password(email: str, password: str, hashed_password: str) -> bool:
+    """
+    校验密码并缓存结果。
+    缓存键为 HMAC 摘要，内存中不保存明文密码；键中包含密码哈希，修改密码后旧结果自动失效。
+    """
+    key = hmac.new(
+        setting.SECRET_KEY.encode(),
+        b"\x00".join((email.encode(), password.encode(), hashed_password.encode())),
+        hashlib.sha256,
+    ).hexdigest()
+    verified = _verify_cache.get(key)
+    if verified is None:
+        verified = crypto.hash_verify(password, hashed_password)
+        _verify_cache.set(
+            key, verified, VERIFY_CACHE_TTL if verified else VERIFY_FAILED_CACHE_TTL
+        )
+    return verified
+
+
+async def loginToken(email: str, password: str, db: AsyncSession) -> TokenResponse:
     """
     用户登录核心逻辑，生成 JWT Token。
 
@@ -21,7 +65,7 @@ def loginToken(email: str, password: str, db: Session) -> TokenResponse:
     Args:
         email: 邮箱
         password: 密码
-        db (Session): SQLAlchemy 数据库会话。
+        db (AsyncSession): SQLAlchemy 异步数据库会话。
 
     Returns:
         TokenResponse: 包含 access_token 和有效期（秒）的响应对象。
@@ -29,17 +73,18 @@ def loginToken(email: str, password: str, db: Session) -> TokenResponse:
     Raises:
         AuthenticationError: 用户不存在、密码错误或用户被禁用。
     """
-    user = User.get_one(db=db, email=email)
-    # 验证密码
-    if not user or not crypto.hash_verify(password, user.password):
+    user = (await db.scalars(_user_by_email, {"email": email})).first()
+    # 验证密码（bcrypt 为 CPU 密集操作，放到线程池执行，避免阻塞事件循环）
+    if not user or not await run_in_threadpool(
+        _verify_password, email, password, user.password
+    ):
         raise AuthenticationError("用户名或密码错误")
     # 检查用户是否启用
     if not user.is_enabled():
         raise AuthenticationError("用户已被禁用")
-    # 设置 token 有效期（3 小时）
-    expires_delta = timedelta(hours=3)
     # 生成 JWT Token
-    access_token = crypto.jwt_encode(user.id, expires_delta)
-    return TokenResponse(
-        access_token=access_token, expires_in=int(expires_delta.total_seconds())
+    access_token = crypto.jwt_encode(user.id, TOKEN_EXPIRES_DELTA)
+    # 字段均为内部生成的可信值，跳过校验直接构造
+    return TokenResponse.model_construct(
+        token_type="bearer", access_token=access_token, expires_in=TOKEN_EXPIRES_IN
     )
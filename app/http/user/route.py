@@ -10,19 +10,11 @@ router = APIRouter(prefix="/user")
 
 
 @router.get("/me", dependencies=[Depends(get_db)])
-def me(user: User = Depends(depts.get_current_user)):
+async def me(user: User = Depends(depts.get_current_user)):
     """
     获取当前登录用户信息
 
     :param user: 通过依赖注入获取当前用户
     :return: UserDetail 对象
     """
-    return JSONSuccess(
-        data=UserDetail(
-            id=user.id,
-            email=user.email,
-            email_verified_at=user.email_verified_at,
-            state=user.state,
-            created_at=user.created_at,
-        )
-    )
+    return JSONSuccess(data=UserDetail.model_validate(user))
@@ -1,10 +1,13 @@
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class UserDetail(BaseModel):
+    # 允许直接从 ORM 对象读取属性构建模型
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     email: Optional[str]
     email_verified_at: Optional[datetime]
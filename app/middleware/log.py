@@ -1,9 +1,10 @@
 import logging
 import time
 
-from fastapi import Request
 from starlette.types import ASGIApp, Receive, Scope, Send
 
+logger = logging.getLogger(__name__)
+
 
 class Middleware:
     def __init__(self, app: ASGIApp):
@@ -15,12 +16,12 @@ class Middleware:
             await self.app(scope, receive, send)
             return
 
-        # 构建请求对象
-        request = Request(scope, receive)
-        start_time = time.time()
-        client_ip = request.client.host if request.client else "unknown"
-        method = request.method
-        path = request.url.path
+        # 直接读取 scope 中的请求信息，无需构建 Request 对象
+        start_time = time.perf_counter()
+        client = scope.get("client")
+        client_ip = client[0] if client else "unknown"
+        method = scope["method"]
+        path = scope["path"]
         # 用于捕获响应状态码
         status_code = 500  # 默认错误状态码
 
@@ -34,14 +35,26 @@ class Middleware:
             # 处理请求
             await self.app(scope, receive, send_wrapper)
         except Exception as e:
-            logging.error(
-                f"{client_ip} - [{method}] {path} | 500 | {time.time() - start_time:.3f}s | 错误: {str(e)}"
+            logger.error(
+                "%s - [%s] %s | 500 | %.3fs | 错误: %s",
+                client_ip,
+                method,
+                path,
+                time.perf_counter() - start_time,
+                e,
             )
             raise
         else:
-            # 计算响应时间（保留3位小数，与Gin一致）
-            response_time = (time.time() - start_time) * 1000  # 转换为毫秒
-            # [时间] [级别] 客户端IP - [方法] 路径 | 状态码 | 响应时间
-            logging.info(
-                f"{client_ip} - [{method}] {path} | {status_code} | {response_time:.3f}ms"
-            )
+            # 日志级别未开启时跳过耗时计算与格式化
+            if logger.isEnabledFor(logging.INFO):
+                # 计算响应时间（保留3位小数，与Gin一致），转换为毫秒
+                response_time = (time.perf_counter() - start_time) * 1000
+                # [时间] [级别] 客户端IP - [方法] 路径 | 状态码 | 响应时间
+                logger.info(
+                    "%s - [%s] %s | %d | %.3fms",
+                    client_ip,
+                    method,
+                    path,
+                    status_code,
+                    response_time,
+                )
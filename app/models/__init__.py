@@ -1,10 +1,10 @@
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel
-from sqlalchemy import DateTime, create_engine, pool
+from sqlalchemy import DateTime, Select, create_engine, make_url, pool, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import Mapped, Session, mapped_column, sessionmaker
+from sqlalchemy.orm import Mapped, mapped_column, sessionmaker
 
 from config import setting
 
@@ -13,20 +13,60 @@ from config import setting
 # -----------------------------
 Base = declarative_base()
 
-connect_args = (
-    {"check_same_thread": False} if setting.DATABASE_URL.startswith("sqlite") else {}
-)
+if setting.DATABASE_URL.startswith("sqlite"):
+    # SQLite 为本地文件，无需连接池
+    engine_args = {
+        "poolclass": pool.NullPool,
+        "connect_args": {"check_same_thread": False},
+    }
+else:
+    # MySQL/PostgreSQL 等使用连接池复用连接，避免每个请求都重新握手
+    engine_args = {
+        "pool_size": setting.DATABASE_POOL_SIZE,
+        "max_overflow": setting.DATABASE_MAX_OVERFLOW,
+        "pool_pre_ping": True,  # 取出连接前检测可用性
+        "pool_recycle": setting.DATABASE_POOL_RECYCLE,
+    }
 
-# 创建数据库引擎
+# 创建数据库引擎（同步，用于迁移工具、定时任务等非请求场景）
 engine = create_engine(
     setting.DATABASE_URL,
-    poolclass=pool.NullPool,
-    connect_args=connect_args,
-    echo=True,  # 打印 SQL 日志，可选
+    echo=setting.DATABASE_ECHO,  # 打印 SQL 日志，可选
+    **engine_args,
 )
 # 创建 Session 工厂
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# 同步驱动对应的异步驱动，未单独配置 DATABASE_ASYNC_URL 时据此推导
+_ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "mysql": "mysql+aiomysql",
+}
+
+
+def _async_url(url: str) -> str:
+    """将同步数据库 URL 转换为对应异步驱动的 URL"""
+    parsed = make_url(url)
+    driver = _ASYNC_DRIVERS.get(parsed.get_backend_name())
+    if driver is None:
+        return url
+    return parsed.set(drivername=driver).render_as_string(hide_password=False)
+
+
+# 异步引擎：请求处理中使用，等待数据库时让出事件循环，不占用线程池
+# SQLite 由 aiosqlite 在独立线程中访问，无需 check_same_thread 参数
+async_engine_args = {k: v for k, v in engine_args.items() if k != "connect_args"}
+async_engine = create_async_engine(
+    setting.DATABASE_ASYNC_URL or _async_url(setting.DATABASE_URL),
+    echo=setting.DATABASE_ECHO,
+    **async_engine_args,
+)
+# 异步 Session 工厂；提交后不使对象过期，避免在异步上下文中触发隐式加载
+AsyncSessionLocal = async_sessionmaker(
+    async_engine, autoflush=False, expire_on_commit=False
+)
+
 
 # -----------------------------
 # 基础模型
@@ -50,8 +90,13 @@ class BaseModel(Base):
     )
 
     @classmethod
-    def get_one(cls, db: Session, **filters) -> Optional[BaseModel]:
-        return db.query(cls).filter_by(**filters).first()
+    def get_one(cls, **filters) -> Select:
+        """
+        返回按条件查询单条记录的 select 语句，
+        同步 Session 与 AsyncSession 均可执行，例如：
+            (await db.scalars(User.get_one(email=email))).first()
+        """
+        return select(cls).filter_by(**filters).limit(1)
 
 
 # -----------------------------
@@ -73,6 +118,10 @@ class BaseModelWithSoftDelete(BaseModel):
     # 类方法
     # -----------------------------
     @classmethod
-    def undelete(cls, db: Session):
-        # 返回 Query 对象，而不是列表
-        return db.query(cls).filter(cls.deleted_at.is_(None))
+    def undelete(cls) -> Select:
+        """
+        返回查询未删除记录的 select 语句，可继续追加条件，
+        同步 Session 与 AsyncSession 均可执行，例如：
+            await db.scalars(User.undelete().where(User.email == email))
+        """
+        return select(cls).where(cls.deleted_at.is_(None))
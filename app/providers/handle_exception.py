@@ -1,60 +1,70 @@
-from fastapi import HTTPException, Request, status
+from operator import itemgetter
+
+from fastapi import HTTPException, Request, Response, status
 from fastapi.exceptions import RequestValidationError
 
 from app.exceptions.exception import (AuthenticationError, AuthorizationError,
                                       BusinessException)
-from app.support.fast import JSONCodeError, JSONError
+from app.support.fast import JSONError
 
+# 取校验错误的 msg 字段
+_get_msg = itemgetter("msg")
 
-def register(app):
+# 由统一处理器接管的异常类型
+_HANDLED_EXCEPTIONS = (
+    RequestValidationError,
+    AuthenticationError,
+    AuthorizationError,
+    BusinessException,
+    HTTPException,
+)
+
+
+def _err(code: int, message: str, http_code: int | None = None) -> Response:
     """
-    注册应用的全局异常处理器。
+    构造错误响应，http_code 缺省时与业务码一致。
+    高频错误的响应体由 fast.py 统一预序列化并复用。
+    """
+    if http_code is None:
+        http_code = code
+    return JSONError(message=message, code=code, http_code=http_code)
+
+
+async def _handle(request: Request, e: Exception) -> Response:
     """
+    统一异常处理器，按异常类型分发（按出现频率排序）：
 
-    @app.exception_handler(AuthenticationError)
-    async def authentication_exception_handler(
-        request: Request, e: AuthenticationError
-    ):
-        """
-        处理身份验证失败的异常 (AuthenticationError)
-        返回 HTTP 401 未授权响应
-        """
-        # 转成 dict 再返回
-        return JSONCodeError(code=status.HTTP_401_UNAUTHORIZED, message=e.message)
-
-    @app.exception_handler(AuthorizationError)
-    async def authorization_exception_handler(request: Request, e: AuthorizationError):
-        """
-        处理权限不足的异常 (AuthorizationError)
-        返回 HTTP 403 禁止访问响应
-        """
-        return JSONCodeError(message=e.message, code=status.HTTP_403_FORBIDDEN)
-
-    @app.exception_handler(BusinessException)
-    async def business_exception_handler(request: Request, e: BusinessException):
-        """
-        处理权限不足的异常 (AuthorizationError)
-        返回 HTTP 403 禁止访问响应
-        """
-        return JSONError(message=e.message, code=e.code, http_code=e.status_code)
-
-    @app.exception_handler(HTTPException)
-    async def custom_http_exception_handler(request: Request, e: HTTPException):
-        """
-        处理 StarletteHTTPException 异常
-        """
-        return JSONCodeError(message=e.detail, code=e.status_code)
-
-    @app.exception_handler(RequestValidationError)
-    async def validation_exception_handler(request: Request, e: RequestValidationError):
-        """
-        处理请求验证异常 (RequestValidationError)
-        """
+    - RequestValidationError：请求参数校验失败，返回 HTTP 422
+    - AuthenticationError：身份验证失败，返回 HTTP 401
+    - AuthorizationError：权限不足，返回 HTTP 403
+    - BusinessException：业务异常，按异常携带的 code/status_code 返回
+    - HTTPException：标准 HTTP 异常，按其状态码返回
+    """
+    if isinstance(e, RequestValidationError):
         errors = e.errors()
-        if errors:
-            full_message = ", ".join(err.get("msg", "参数校验错误") for err in errors)
-        else:
-            full_message = "参数校验失败"
-        return JSONCodeError(
-            message=full_message, code=status.HTTP_422_UNPROCESSABLE_ENTITY
-        )
+        if not errors:
+            return _err(status.HTTP_422_UNPROCESSABLE_ENTITY, "参数校验失败")
+        try:
+            # pydantic 校验错误均带 msg，直接在 C 层取值拼接
+            full_message = ", ".join(map(_get_msg, errors))
+        except KeyError:
+            full_message = (
+                ", ".join([err["msg"] for err in errors if "msg" in err])
+                or "参数校验错误"
+            )
+        return _err(status.HTTP_422_UNPROCESSABLE_ENTITY, full_message)
+    if isinstance(e, AuthenticationError):
+        return _err(status.HTTP_401_UNAUTHORIZED, e.message)
+    if isinstance(e, AuthorizationError):
+        return _err(status.HTTP_403_FORBIDDEN, e.message)
+    if isinstance(e, BusinessException):
+        return _err(e.code, e.message, e.status_code)
+    return _err(e.status_code, e.detail)
+
+
+def register(app):
+    """
+    注册应用的全局异常处理器。
+    """
+    for exc_class in _HANDLED_EXCEPTIONS:
+        app.add_exception_handler(exc_class, _handle)
@@ -1,7 +1,5 @@
 import logging
 
-from routes.api import api_router
-
 
 def boot(app):
     """
@@ -16,6 +14,9 @@ def boot(app):
     # ------------------------
     # 将 api_router 包含进主应用，并添加统一前缀 /api
     # 例如：api_router 中定义的 /users 路径，最终访问路径为 /api/users
+    # 在启动时才导入路由模块，仅间接导入 app.providers 的工具（如调度器）无需加载全部路由
+    from routes.api import api_router
+
     app.include_router(api_router, prefix="/api")
 
     # ------------------------
@@ -24,10 +25,19 @@ def boot(app):
     # 当应用处于 debug 模式时，遍历所有注册的路由并打印
     # 方便开发者查看路由路径、名称和允许的 HTTP 方法
     if app.debug:
-        for route in app.routes:
-            # FastAPI 路由可能有多种类型，我们只关注 API 路由
-            if hasattr(route, "methods") and hasattr(route, "endpoint"):
-                methods = ", ".join(route.methods) if route.methods else "N/A"
-                path = route.path
-                handler_name = getattr(route.endpoint, "__name__", "N/A")
-                logging.info("%-6s %-30s %-30s", methods, path, handler_name)
+        # FastAPI 路由可能有多种类型，我们只关注带 HTTP 方法的 API 路由
+        rows = tuple(
+            (
+                ", ".join(sorted(route.methods)),
+                route.path,
+                getattr(route.endpoint, "__name__", "N/A"),
+            )
+            for route in app.routes
+            if getattr(route, "methods", None) and hasattr(route, "endpoint")
+        )
+        # 拼接为一条日志输出，避免逐条记录
+        logging.info(
+            "已注册 %d 个路由:\n%s",
+            len(rows),
+            "\n".join("{:<6} {:<30} {:<30}".format(*row) for row in rows),
+        )
@@ -1,45 +1,140 @@
+import asyncio
+import hashlib
+import time
+from collections.abc import AsyncIterator
 from typing import Annotated
 
 import jwt
 from fastapi import Depends
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy.orm import Session
+from sqlalchemy import bindparam
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.exceptions.exception import AuthenticationError
-from app.models import SessionLocal
+from app.models import AsyncSessionLocal
 from app.models.user import User
+from config import setting
 from libs import crypto
+from libs.cache import MemoryCache
 
+# -----------------------------
+# 认证结果缓存
+# -----------------------------
+# 认证结果缓存，可通过 AUTH_CACHE_ENABLED 关闭
+# token 解码结果（sub）缓存：以 token 的 BLAKE2b 摘要为键（不保存原始 token），短时间内重复请求无需再次验签
+_token_cache = MemoryCache(max_size=10000)
+TOKEN_CACHE_TTL = 30
+# 用户缓存：以用户 ID 为键，避免每次请求都查询数据库
+_user_cache = MemoryCache(max_size=5000)
+USER_CACHE_TTL = 60
+# 正在查询中的用户：同一用户的并发请求共享一次数据库查询
+_user_inflight: dict[str, asyncio.Future] = {}
 
-def get_db():
+# Bearer 认证方案，模块级单例，所有依赖共享同一个实例
+_bearer = HTTPBearer(auto_error=True)
+
+# 按 ID 查询未删除用户的语句，模块加载时构建一次，SQL 编译结果由 SQLAlchemy 缓存复用
+_user_by_id = User.undelete().where(User.id == bindparam("user_id"))
+
+
+async def get_db() -> AsyncIterator[AsyncSession]:
     """
-    FastAPI 依赖，用于提供 SQLAlchemy Session。
+    FastAPI 依赖，用于提供 SQLAlchemy AsyncSession。
     在请求结束后自动关闭数据库连接。
     """
-    db: Session = SessionLocal()
-    try:
+    async with AsyncSessionLocal() as db:
         yield db
+
+
+def _decode_subject(token: str) -> str:
+    """
+    解码 JWT 并缓存其 sub（用户 ID）。
+    缓存有效期不超过 token 自身的剩余有效期。
+    """
+    if not setting.AUTH_CACHE_ENABLED:
+        return crypto.jwt_decode_subject(token)[0]
+    key = hashlib.blake2b(token.encode(), digest_size=16).hexdigest()
+    subject = _token_cache.get(key)
+    if subject is not None:
+        return subject
+    subject, exp = crypto.jwt_decode_subject(token)
+    ttl = TOKEN_CACHE_TTL
+    if exp is not None:
+        ttl = min(ttl, int(exp - time.time()))
+    if ttl > 0:
+        _token_cache.set(key, subject, ttl)
+    return subject
+
+
+async def _load_user(db: AsyncSession, user_id: int) -> User | None:
+    """
+    根据用户 ID 获取未删除的用户，优先读取缓存。
+    缓存未命中时，同一用户的并发请求只由第一个请求查询数据库，其余请求等待其结果。
+    """
+    if not setting.AUTH_CACHE_ENABLED:
+        return (await db.scalars(_user_by_id, {"user_id": user_id})).first()
+    # 缓存以字符串 ID 为键，与 pop_user 一致
+    key = str(user_id)
+    user = _user_cache.get(key)
+    if user is not None:
+        return user
+
+    while (future := _user_inflight.get(key)) is not None:
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            # 仅当发起查询的请求被取消时改由本请求查询，自身被取消则照常抛出
+            if not future.cancelled() or asyncio.current_task().cancelling():
+                raise
+    future = asyncio.get_running_loop().create_future()
+    _user_inflight[key] = future
+
+    try:
+        user = (await db.scalars(_user_by_id, {"user_id": user_id})).first()
+        if user is not None:
+            # 从会话中分离，缓存的用户对象作为只读快照跨请求复用
+            db.expunge(user)
+            _user_cache.set(key, user, USER_CACHE_TTL)
+        future.set_result(user)
+        return user
+    except Exception as e:
+        future.set_exception(e)
+        # 标记异常已读取，避免没有等待者时 asyncio 输出未处理异常警告
+        future.exception()
+        raise
     finally:
-        db.close()
+        _user_inflight.pop(key, None)
+        # 查询被取消时通知等待者
+        if not future.done():
+            future.cancel()
+
+
+def pop_user(user_id) -> None:
+    """
+    移除缓存的用户，在用户被禁用、删除或权限变更后调用，使变更立即生效。
+
+    :param user_id: 用户 ID
+    """
+    _user_cache.delete(str(user_id))
 
 
-def get_current_user(
-    credentials: Annotated[HTTPAuthorizationCredentials, Depends(HTTPBearer())],
-    db: Session = Depends(get_db),
+async def get_current_user(
+    credentials: Annotated[HTTPAuthorizationCredentials, Depends(_bearer)],
+    db: AsyncSession = Depends(get_db),
 ) -> User:
     try:
-        payload = crypto.jwt_decode(credentials.credentials)
+        # 主键为整数，asyncpg 等驱动不接受字符串参数，查询前先转换
+        user_id = int(_decode_subject(credentials.credentials))
     except jwt.ExpiredSignatureError:
         # token 已过期
         raise AuthenticationError(message="Token Expired")
-    except jwt.InvalidTokenError:
-        # token 无效
+    except (jwt.InvalidTokenError, ValueError):
+        # token 无效或 sub 不是合法的用户 ID
         raise AuthenticationError(message="Could not validate credentials")
     except Exception as e:
         # 处理其他未预料到的异常
         raise AuthenticationError(message=f"Token validation failed: {str(e)}")
-    user_id = payload.get("sub")
-    user = User.undelete(db).filter(User.id == user_id).first()
+    user = await _load_user(db, user_id) if user_id else None
     if not user:
         raise AuthenticationError(message="User not found")
     if not user.is_enabled():
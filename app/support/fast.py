@@ -1,42 +1,65 @@
-from datetime import datetime
+from decimal import Decimal
 from typing import Any, Optional
 
-from fastapi.responses import JSONResponse, Response
+import orjson
+from fastapi.responses import Response
 from pydantic import BaseModel
 
 
-def _convert_pydantic_to_dict(data: Any) -> Any:
+def _orjson_default(obj: Any) -> Any:
     """
-    递归转换数据为可 JSON 序列化格式
-    支持：Pydantic 模型、datetime、列表、字典、None 等
+    orjson 无法原生序列化的类型在此转换
+    datetime、UUID、dataclass 等由 orjson 原生处理
     """
-    # 处理 None（避免空值递归报错）
-    if data is None:
-        return None
-    # 处理 Pydantic 模型（优先转换为字典）
-    if isinstance(data, BaseModel):
-        return _convert_pydantic_to_dict(data.dict())
-    # 处理 datetime 类型（核心序列化逻辑）
-    if isinstance(data, datetime):
-        return data.isoformat()
-    # 处理列表（递归转换每个元素）
-    if isinstance(data, list):
-        return [_convert_pydantic_to_dict(item) for item in data]
-    # 处理字典（递归转换每个值）
-    if isinstance(data, dict):
-        return {k: _convert_pydantic_to_dict(v) for k, v in data.items()}
-    return data
+    # 处理 Pydantic 模型（转换为字典后由 orjson 继续序列化）
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    # 处理 Decimal（转换为字符串，避免精度丢失）
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+_JSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+_JSON_MEDIA_TYPE = "application/json"
+
+
+def _dumps(content: Any) -> bytes:
+    """使用 orjson 序列化，并通过 default 钩子支持 Pydantic 模型等类型"""
+    return orjson.dumps(content, default=_orjson_default, option=_JSON_OPTIONS)
+
+
+# 高频无数据响应体，模块加载时序列化一次，(code, message) 命中时直接复用
+_CACHED_BODIES = {
+    (code, message): _dumps({"code": code, "message": message, "data": None})
+    for code, message in (
+        (200, "success"),
+        (401, "Unauthorized"),
+        (401, "Token Expired"),
+        (401, "Could not validate credentials"),
+        (401, "User not found"),
+        (401, "Inactive user"),
+        (403, "Forbidden"),
+        (422, "参数校验失败"),
+        (500, "Error"),
+    )
+}
 
 
 def createJSONResponse(
     code: int, message: str, data: Optional[Any] = None, http_code: int = 200
 ) -> Response:
-    response_data = {
-        "code": code,
-        "message": message,
-        "data": _convert_pydantic_to_dict(data),
-    }
-    return JSONResponse(content=response_data, status_code=http_code)
+    # message 可能是 HTTPException.detail 传入的 dict/list（不可哈希），只有字符串才查表
+    if data is None and isinstance(message, str):
+        body = _CACHED_BODIES.get((code, message))
+        if body is not None:
+            return Response(
+                content=body, media_type=_JSON_MEDIA_TYPE, status_code=http_code
+            )
+    # Pydantic 模型、datetime 等嵌套值由 orjson 在 C 层遍历，default 钩子兜底转换
+    body = _dumps({"code": code, "message": message, "data": data})
+    # 已是序列化好的字节，直接用基础 Response 包装，避免 ORJSONResponse 再次 render
+    return Response(content=body, media_type=_JSON_MEDIA_TYPE, status_code=http_code)
 
 
 def JSONSuccess(data: Optional[Any] = None, message: str = "success"):
@@ -7,12 +7,13 @@ from boot.scheduler import app
 # 定时任务示例 1：间隔触发（Interval）
 # ==========================================
 @app.scheduled_job("interval", seconds=10, id="interval_job")
-def minute_task():
+async def minute_task():
     """
     每隔 10 秒执行一次的任务
     - 'interval' 表示间隔触发器
     - seconds=10 表示每 10 秒执行一次
     - id='interval_job' 为这个任务分配唯一 ID，方便管理（修改、删除等）
+    - 定义为协程，由 AsyncIOScheduler 直接在事件循环中执行，无需切换线程
     """
     print(f"[Task] 当前时间: {datetime.datetime.now()}")
 
@@ -21,7 +22,7 @@ def minute_task():
 # 定时任务示例 2：Cron 表达式触发（Cron）
 # ==========================================
 @app.scheduled_job("cron", second=1, id="cron_job")
-def trigger_worker_cron():
+async def trigger_worker_cron():
     """
     每分钟的第 1 秒执行一次的任务
     - 'cron' 表示使用 cron 触发器，可精确控制执行时间
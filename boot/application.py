@@ -6,6 +6,8 @@ from fastapi.responses import ORJSONResponse
 
 from app.middleware import log
 from app.providers import handle_exception, route_provider
+from config import setting
+from libs import cache
 
 
 @asynccontextmanager
@@ -16,12 +18,16 @@ async def lifespan(app: FastAPI):
         yield
         # TODO stop process
         logging.info("应用生命周期即将结束 - 开始清理资源")
+        # 关闭请求处理中使用的异步 Redis 连接池
+        await cache.close_async_redis_cache()
     finally:
         logging.info("应用生命周期结束 - 所有资源已清理")
 
 
 def create_app() -> FastAPI:
-    app = FastAPI(debug=True, lifespan=lifespan, default_response_class=ORJSONResponse)
+    app = FastAPI(
+        debug=setting.DEBUG, lifespan=lifespan, default_response_class=ORJSONResponse
+    )
     register(app, handle_exception)  # 注册异常处理提供器
     boot(app, route_provider)  # 启动路由提供器
     app.add_middleware(log.Middleware)
@@ -41,7 +47,7 @@ def register(app, provider):
     并记录日志表示注册完成。
     """
     provider.register(app)
-    logging.info(provider.__name__ + " registered")  # 打印注册日志
+    logging.info("%s registered", provider.__name__)  # 打印注册日志
 
 
 def boot(app, provider):
@@ -57,4 +63,4 @@ def boot(app, provider):
     并记录日志表示启动完成。
     """
     provider.boot(app)
-    logging.info(provider.__name__ + " booted")  # 打印启动日志
+    logging.info("%s booted", provider.__name__)  # 打印启动日志
@@ -19,12 +19,14 @@ def create_app() -> Celery:
     registered_tasks = list(app.tasks.keys())
 
     custom_tasks = [task for task in registered_tasks if not task.startswith("celery.")]
-    if custom_tasks:
-        logging.info(f"成功加载 {len(custom_tasks)} 个自定义任务:")
-        for task in custom_tasks[:5]:  # 只显示前5个，避免日志过长
-            logging.info(f"  - {task}")
-        if len(custom_tasks) > 5:
-            logging.info(f"  - 以及 {len(custom_tasks) - 5} 个更多任务...")
-    else:
+    if not custom_tasks:
         logging.warning("未发现任何自定义任务，请检查任务模块是否正确配置")
+    elif logging.getLogger().isEnabledFor(logging.INFO):
+        # 只显示前5个，避免日志过长；拼接为一条日志输出，避免逐条记录
+        lines = [f"  - {task}" for task in custom_tasks[:5]]
+        if len(custom_tasks) > 5:
+            lines.append(f"  - 以及 {len(custom_tasks) - 5} 个更多任务...")
+        logging.info(
+            "成功加载 %d 个自定义任务:\n%s", len(custom_tasks), "\n".join(lines)
+        )
     return app
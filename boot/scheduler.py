@@ -16,7 +16,7 @@ app = AsyncIOScheduler(
     # 任务默认参数（统一控制任务行为）
     job_defaults={
         "coalesce": True,  # 合并错过的重复任务（避免任务堆积）
-        "max_instances": 3,  # 同一任务最大并发实例数
+        "max_instances": 1,  # 同一任务最大并发实例数
         "misfire_grace_time": 30,  # 任务误触发容忍时间（秒）
     },
 )
@@ -30,9 +30,12 @@ def create_app() -> AsyncIOScheduler:
     # 打印已注册的任务列表，便于验证
     jobs = app.get_jobs()
     if jobs:
-        logging.info(f"成功加载 {len(jobs)} 个定时任务:")
-        for job in jobs:
-            logging.info(f"  - 任务ID: {job.id} | 触发器: {job.trigger}")
+        # 拼接为一条日志输出，避免逐条记录；日志级别未开启时跳过拼接
+        if logging.getLogger().isEnabledFor(logging.INFO):
+            body = "\n".join(
+                f"  - 任务ID: {job.id} | 触发器: {job.trigger}" for job in jobs
+            )
+            logging.info("成功加载 %d 个定时任务:\n%s", len(jobs), body)
     else:
         logging.warning("未发现任何定时任务，请检查任务模块是否正确配置")
 
@@ -1,10 +1,15 @@
+import functools
 import logging
+import os
 import sys
 
 from loguru import logger
 
 from config import setting
 
+# logging 模块源文件路径，用于在调用栈中跳过 logging 内部帧
+_LOGGING_FILE = logging.__file__
+
 
 def setup():
     """
@@ -20,28 +25,57 @@ def setup():
     )  # 日志文件保存路径，如 "storage/logs/fastapi-{time:YYYY-MM-DD}.log"
     retention = setting.LOG_RETENTION  # 日志保留时间，例如 "14 days"
 
+    # 启动时一次性创建日志目录，无需在首次写入时由日志框架创建
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
     # 拦截所有标准 logging 模块的日志，交由 Loguru 统一处理
     logging.root.handlers = [InterceptHandler()]
     logging.root.setLevel(level)
 
     # 移除其他 logger 的独立 handlers，
     # 让所有日志都向上冒泡到 root logger，由 Loguru 统一输出
-    for name in logging.root.manager.loggerDict.keys():
-        logging.getLogger(name).handlers = []
-        logging.getLogger(name).propagate = True
+    # loggerDict 中可能混有 PlaceHolder 占位对象，只处理真实的 Logger
+    for lg in list(logging.root.manager.loggerDict.values()):
+        if isinstance(lg, logging.Logger):
+            lg.handlers = []
+            lg.propagate = True
+
+    # 非调试模式下关闭异常变量捕获（diagnose）与完整回溯（backtrace），
+    # 避免每次记录异常时的额外开销，同时防止敏感变量值写入日志
+    diagnose = setting.DEBUG
 
     # 配置 Loguru 的输出方式
     logger.configure(
         handlers=[
             # 控制台输出日志（stdout）
-            {"sink": sys.stdout},
+            {"sink": sys.stdout, "diagnose": diagnose, "backtrace": diagnose},
             # 文件输出日志，每天凌晨 00:00 自动轮转日志文件，
-            # 并保留指定天数后自动清理旧日志
-            {"sink": path, "rotation": "00:00", "retention": retention},
+            # 并保留指定天数后自动清理旧日志；
+            # enqueue=True 由后台线程经队列写盘（含轮转与清理），请求线程只做入队
+            {
+                "sink": path,
+                "rotation": "00:00",
+                "retention": retention,
+                "enqueue": True,
+                "diagnose": diagnose,
+                "backtrace": diagnose,
+            },
         ]
     )
 
 
+@functools.lru_cache(maxsize=64)
+def _loguru_level(levelname: str, levelno: int):
+    """
+    将 logging 级别名映射为 Loguru 级别名（结果缓存，级别种类有限）。
+    Loguru 中不存在对应级别时返回数值级别。
+    """
+    try:
+        return logger.level(levelname).name
+    except ValueError:
+        return levelno
+
+
 class InterceptHandler(logging.Handler):
     """
     该类用于拦截 Python 原生 logging 的日志消息，
@@ -53,16 +87,12 @@ class InterceptHandler(logging.Handler):
         emit() 方法在每次 logging 记录日志时被调用，
         record 对象包含日志的详细信息。
         """
-        # 尝试匹配 Loguru 的日志级别名称
-        try:
-            level = logger.level(record.levelname).name
-        except ValueError:
-            # 如果不存在对应级别，则直接使用数值级别
-            level = record.levelno
-
-        # 找到日志实际调用的位置（而不是 logging 内部函数）
-        frame, depth = logging.currentframe(), 2
-        while frame.f_code.co_filename == logging.__file__:
+        # 匹配 Loguru 的日志级别名称（不存在时使用数值级别）
+        level = _loguru_level(record.levelname, record.levelno)
+
+        # 找到日志实际调用的位置（跳过 emit 自身及 logging 内部函数）
+        frame, depth = sys._getframe(1), 1
+        while frame and frame.f_code.co_filename == _LOGGING_FILE:
             frame = frame.f_back
             depth += 1
 
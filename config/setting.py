@@ -3,7 +3,9 @@ from pathlib import Path
 
 from dotenv import load_dotenv
 
-load_dotenv()
+# 设置 SKIP_DOTENV=1 时不读取 .env 文件（如容器中已通过环境变量注入配置）
+if os.getenv("SKIP_DOTENV") != "1":
+    load_dotenv()
 
 # -----------------------------
 # 项目核心路径配置
@@ -14,6 +16,13 @@ load_dotenv()
 # parent.parent：向上两级目录（假设当前文件在"项目根目录/config/"下，此操作定位到项目根目录）
 BASE_DIR = Path(__file__).resolve().parent.parent
 
+# -----------------------------
+# 应用运行模式
+# -----------------------------
+# 调试模式：开启后 FastAPI 以 debug 模式运行、启动时打印路由表，并默认打印 SQL 语句
+# ⚠️ 生产环境务必关闭（设置为 false）
+DEBUG = os.getenv("DEBUG", "false").lower() == "true"
+
 # -----------------------------
 # 数据库配置（SQLite）
 # -----------------------------
@@ -25,6 +34,23 @@ DATABASE_URL = os.getenv(
     "DATABASE_URL", "sqlite:///" + os.path.join(BASE_DIR, "storage", "db.sqlite3")
 )
 
+# 异步数据库连接URL：请求处理使用异步驱动访问数据库
+# 未设置时由 DATABASE_URL 推导：sqlite → sqlite+aiosqlite、postgresql → postgresql+asyncpg、
+# mysql → mysql+aiomysql（需安装对应驱动）
+DATABASE_ASYNC_URL = os.getenv("DATABASE_ASYNC_URL")
+
+# 是否打印执行的 SQL 语句：开启后每条 SQL 都会经由 logging 输出，仅建议在开发调试时开启
+# 未设置时跟随 DEBUG
+DATABASE_ECHO = os.getenv("DATABASE_ECHO", str(DEBUG)).lower() == "true"
+
+# 连接池配置（仅对 MySQL/PostgreSQL 等网络数据库生效，SQLite 不使用连接池）
+# 连接池常驻连接数
+DATABASE_POOL_SIZE = int(os.getenv("DATABASE_POOL_SIZE", "20"))
+# 连接池满时允许额外创建的连接数
+DATABASE_MAX_OVERFLOW = int(os.getenv("DATABASE_MAX_OVERFLOW", "40"))
+# 连接最长存活时间（秒），超时后回收重建，避免被数据库服务端主动断开
+DATABASE_POOL_RECYCLE = int(os.getenv("DATABASE_POOL_RECYCLE", "1800"))
+
 # -----------------------------
 # 日志系统配置
 # 控制日志的输出级别、存储路径和文件生命周期，便于问题排查和系统监控
@@ -38,12 +64,12 @@ LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 # storage/logs/：日志文件存放在项目根目录下的"storage/logs"目录（需确保目录已创建，避免报错）
 # fastapi-{time:YYYY-MM-DD}.log：日志文件按日期命名（如"fastapi-2025-10-16.log"）
 # {time:YYYY-MM-DD}：日志系统的日期占位符，实现"按天分日志"，便于按时间筛选日志文件
-LOG_PATH = os.path.join(BASE_DIR, "storage", "logs", "fastapi-{time:YYYY-MM-DD}.log")
+LOG_PATH = (BASE_DIR / "storage" / "logs" / "fastapi-{time:YYYY-MM-DD}.log").as_posix()
 
 # 日志文件保留时间：控制旧日志的自动清理策略，避免磁盘空间占用过大
 # 设置为"14 days"时，日志系统会自动删除14天前的日志文件
 # 支持的单位：days（天）、hours（小时）、minutes（分钟），需配合数值使用
-LOG_RETENTION = "14 days"
+LOG_RETENTION = os.getenv("LOG_RETENTION", "14 days")
 
 # -----------------------------
 # JWT（JSON Web Token）认证配置
@@ -59,6 +85,15 @@ SECRET_KEY = os.getenv(
     "SECRET_KEY", "09d25e094faa6ca2556c818166b7a9563b93f7099f6f0f4caa6cf63b88e8d3e7"
 )
 
+# bcrypt 密码哈希的计算成本（2 的幂次轮数），每增加 1 计算耗时翻倍；
+# 只影响新生成的哈希，已有哈希按其自身记录的轮数校验
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+
+# 认证结果缓存开关：开启后，已验签的 token 与对应用户会在进程内短暂缓存（秒级），
+# 减少重复验签与数据库查询；关闭后每个请求都会重新验签并查询用户，
+# 适用于需要禁用用户/吊销 token 后立即生效的场景
+AUTH_CACHE_ENABLED = os.getenv("AUTH_CACHE_ENABLED", "true").lower() == "true"
+
 # -----------------------------
 # 定时任务（Crontab）配置
 # -----------------------------
@@ -84,10 +119,22 @@ CRONTAB_PACKAGE_NAME = "app.tasks.crontab"
 #   2. 修改此变量可更换业务任务模块路径，无需改动注册函数逻辑。
 JOB_PACKAGE_NAME = "app.tasks.jobs"
 
+# 扫描任务包时并行导入模块的线程数
+# 默认 1 表示按顺序串行导入；模块较多且彼此没有导入顺序依赖时可适当调大
+MODULE_IMPORT_WORKERS = int(os.getenv("MODULE_IMPORT_WORKERS", "1"))
+
 REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
-REDIS_PORT = os.getenv("REDIS_PORT", 6379)
-REDIS_DB = os.getenv("REDIS_DB", 0)
+# 端口与库编号在加载时转换为整数，避免环境变量的字符串值传入客户端
+REDIS_PORT = int(os.getenv("REDIS_PORT", "6379"))
+REDIS_DB = int(os.getenv("REDIS_DB", "0"))
 REDIS_PASSWORD = os.getenv("REDIS_PASSWORD", None)
+# 每个进程的 Redis 连接池上限：同一时刻最多有这么多条命令在执行，
+# 连接全部占用时后续命令等待空闲连接，等待超过 REDIS_POOL_TIMEOUT 秒才失败；
+# GET/SET 这类快速命令很快归还连接，多 worker 部署时总连接数为 worker 数 × 该值，默认按 CPU 核数估算
+REDIS_MAX_CONNECTIONS = int(
+    os.getenv("REDIS_MAX_CONNECTIONS", max(4, (os.cpu_count() or 2) * 2))
+)
+REDIS_POOL_TIMEOUT = float(os.getenv("REDIS_POOL_TIMEOUT", "5"))
 CACHE_CFG = {
     "type": "memory",
     "redis": {
@@ -95,8 +142,19 @@ CACHE_CFG = {
         "port": REDIS_PORT,
         "db": REDIS_DB,
         "password": REDIS_PASSWORD,
-        "max_connections": 10,
+        "max_connections": REDIS_MAX_CONNECTIONS,
+        "pool_timeout": REDIS_POOL_TIMEOUT,
         "decode_responses": False,
+        "socket_keepalive": True,  # 开启 TCP keepalive，避免空闲连接被中间设备断开
+        "health_check_interval": 30,  # 连接空闲超过该秒数后，使用前先做健康检查
+    },
+    # max_bytes：缓存值占用的最大字节数（估算值），None 表示只按条目数限制
+    # low_watermark_ratio：超出上限后一次性淘汰到上限的该比例，调低可减少淘汰次数
+    # compress：是否压缩存储较大的值（pickle + zlib），以 CPU 换内存
+    "memory": {
+        "max_size": 1000,
+        "max_bytes": None,
+        "low_watermark_ratio": 0.9,
+        "compress": False,
     },
-    "memory": {"max_size": 1000},
 }
@@ -1,30 +1,90 @@
+import asyncio
+import glob
+import hashlib
+import itertools
+import logging
 import os
 import pickle
+import struct
+import sys
 import threading
 import time
+import weakref
+import zlib
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, Tuple
+from collections import OrderedDict
+from typing import Any, Optional
 
 import redis
+import redis.asyncio
 from redis import Redis
 from redis.exceptions import RedisError
 
 from config import setting
-from libs.dicts import array_deep_merge
+
+logger = logging.getLogger(__name__)
+
+# -----------------------------
+# 过期条目后台清理
+# -----------------------------
+# 内存/文件缓存的过期条目由一个后台线程定期批量清理，读取路径只判断是否过期而不做删除
+REAP_INTERVAL = 60
+_reap_targets: "weakref.WeakSet" = weakref.WeakSet()
+_reaper_lock = threading.Lock()
+_reaper: threading.Thread | None = None
+
+
+def _reap_loop() -> None:
+    while True:
+        time.sleep(REAP_INTERVAL)
+        with _reaper_lock:
+            targets = list(_reap_targets)
+        for target in targets:
+            try:
+                target.purge_expired()
+            except Exception:
+                logger.exception("清理过期缓存失败：%r", target)
+
+
+def _start_reaper() -> None:
+    """启动后台清理线程（需持有 _reaper_lock 调用）。"""
+    global _reaper
+    _reaper = threading.Thread(target=_reap_loop, name="cache-reaper", daemon=True)
+    _reaper.start()
+
+
+def _register_reaper(target) -> None:
+    """登记需要定期清理的缓存实例，首次登记时启动后台线程。"""
+    with _reaper_lock:
+        _reap_targets.add(target)
+        if _reaper is None:
+            _start_reaper()
+
+
+def _reset_reaper_after_fork() -> None:
+    # fork 出的子进程（多 worker 部署）不会继承线程，需要重新启动
+    global _reaper, _reaper_lock
+    _reaper_lock = threading.Lock()
+    _reaper = None
+    if _reap_targets:
+        _start_reaper()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_reaper_after_fork)
 
 
 class CacheInterface(ABC):
     """缓存接口规范，定义通用缓存操作。"""
 
     @abstractmethod
-    def get(self, key: str) -> Optional[Any]:
+    def get(self, key: str) -> Any | None:
         """
         获取指定键的缓存值。
 
         :param key: 缓存键，非空字符串
         :return: 缓存值，键不存在/已过期/异常返回 None
         """
-        pass
 
     @abstractmethod
     def set(self, key: str, value: Any, expire_seconds: int = 300) -> None:
@@ -37,16 +97,15 @@ class CacheInterface(ABC):
         :raises ValueError: 键为空或过期时间不合法
         :raises RuntimeError: 存储失败（如Redis连接异常）
         """
-        pass
 
     @abstractmethod
-    def delete(self, key: str) -> None:
+    def delete(self, key: str) -> bool:
         """
         删除指定缓存键。失败或不存在时静默处理。
 
         :param key: 缓存键，非空字符串
+        :return: True 表示键由本次调用删除；并发删除同一键时仅一个调用返回 True
         """
-        pass
 
     @abstractmethod
     def exists(self, key: str) -> bool:
@@ -56,20 +115,51 @@ class CacheInterface(ABC):
         :param key: 缓存键，非空字符串
         :return: True 表示键存在且有效，否则 False
         """
-        pass
+
+    @abstractmethod
+    def get_and_delete(self, key: str) -> Any | None:
+        """
+        获取指定键的缓存值并同时删除该键（原子操作）。
+
+        :param key: 缓存键，非空字符串
+        :return: 缓存值，键不存在/已过期/异常返回 None
+        """
+
+    @abstractmethod
+    def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """
+        批量获取缓存值。
+
+        :param keys: 缓存键列表
+        :return: 命中的键值字典，不存在/已过期的键不包含在结果中
+        """
+
+    @abstractmethod
+    def set_many(self, mapping: dict[str, Any], expire_seconds: int = 300) -> None:
+        """
+        批量设置缓存值，所有键使用相同的过期时间。
+
+        :param mapping: 键值字典
+        :param expire_seconds: 过期时间（秒），正整数，默认300秒
+        :raises ValueError: 键为空或过期时间不合法
+        :raises RuntimeError: 存储失败（如Redis连接异常）
+        """
 
 
 class RedisCache(CacheInterface):
-    """基于 Redis 的缓存实现，支持多线程安全操作。"""
+    """基于 Redis 的缓存实现，支持多线程安全操作（由连接池保证）。"""
 
     def __init__(
         self,
         host: str = "localhost",
         port: int = 6379,
         db: int = 0,
-        password: Optional[str] = None,
+        password: str | None = None,
         max_connections: int = 10,
+        pool_timeout: float = 5,
         decode_responses: bool = False,
+        socket_keepalive: bool = True,
+        health_check_interval: int = 30,
     ):
         """
         初始化 Redis 连接池。
@@ -79,191 +169,645 @@ class RedisCache(CacheInterface):
         :param db: Redis 数据库编号
         :param password: Redis 密码
         :param max_connections: 连接池最大连接数
+        :param pool_timeout: 连接全部占用时等待空闲连接的最长秒数，超时后命令失败
         :param decode_responses: 是否将返回字节自动解码为字符串
+        :param socket_keepalive: 是否开启 TCP keepalive
+        :param health_check_interval: 连接空闲超过该秒数后，使用前先做健康检查
         """
-        self._pool = redis.ConnectionPool(
+        # 未指定 parser_class：安装了 hiredis 时 redis-py 自动使用其 C 实现的协议解析器
+        # 阻塞式连接池：连接数达到上限时等待其他命令归还连接，而不是直接报错
+        self._pool = redis.BlockingConnectionPool(
             host=host,
             port=port,
             db=db,
             password=password,
             max_connections=max_connections,
+            timeout=pool_timeout,
             decode_responses=decode_responses,
+            socket_keepalive=socket_keepalive,
+            health_check_interval=health_check_interval,
         )
-        self._lock = threading.Lock()
-
-    @property
-    def _client(self) -> Redis:
-        """获取 Redis 客户端实例（使用连接池）。"""
-        return redis.Redis(connection_pool=self._pool)
+        # 客户端实例只创建一次，每次操作由连接池分配连接；
+        # redis-py 的 ConnectionPool 是线程安全的，每个命令独立取用连接，无需额外加锁
+        self._client: Redis = redis.Redis(connection_pool=self._pool)
 
-    def get(self, key: str) -> Optional[Any]:
-        if not isinstance(key, str) or not key.strip():
+    def get(self, key: str) -> Any | None:
+        # 读路径只做空值判断，键的类型与内容校验放在写入时
+        if not key:
+            return None
+        try:
+            return self._client.get(key)
+        except RedisError:
             return None
-        with self._lock:
-            try:
-                return self._client.get(key)
-            except RedisError:
-                return None
 
     def set(self, key: str, value: Any, expire_seconds: int = 300) -> None:
-        if not isinstance(key, str) or not key.strip():
+        if not isinstance(key, str) or not key or key.isspace():
             raise ValueError("键必须为非空字符串")
         if not isinstance(expire_seconds, int) or expire_seconds <= 0:
             raise ValueError("过期时间必须为正整数（秒）")
-        with self._lock:
-            try:
-                self._client.set(key, value, ex=expire_seconds)
-            except RedisError as e:
-                raise RuntimeError(f"Redis 设置缓存失败（key: {key}）：{e}")
+        try:
+            self._client.set(key, value, ex=expire_seconds)
+        except RedisError as e:
+            raise RuntimeError(f"Redis 设置缓存失败（key: {key}）：{e}")
 
-    def delete(self, key: str) -> None:
-        if isinstance(key, str) and key.strip():
-            with self._lock:
-                try:
-                    self._client.delete(key)
-                except RedisError:
-                    pass
+    def delete(self, key: str) -> bool:
+        if not key:
+            return False
+        try:
+            # DEL 返回实际删除的键数
+            return self._client.delete(key) == 1
+        except RedisError:
+            return False
 
     def exists(self, key: str) -> bool:
-        if not isinstance(key, str) or not key.strip():
+        if not key:
             return False
-        with self._lock:
-            try:
-                return self._client.exists(key) == 1
-            except RedisError:
-                return False
+        try:
+            return self._client.exists(key) == 1
+        except RedisError:
+            return False
+
+    def get_and_delete(self, key: str) -> Any | None:
+        if not key:
+            return None
+        try:
+            # GETDEL（Redis 6.2+）一次往返完成读取与删除
+            return self._client.getdel(key)
+        except RedisError:
+            return None
+
+    def get_many(self, keys: list[str]) -> dict[str, Any]:
+        keys = [key for key in keys if key]
+        if not keys:
+            return {}
+        try:
+            # MGET 一次往返取回全部键
+            values = self._client.mget(keys)
+        except RedisError:
+            return {}
+        return {key: value for key, value in zip(keys, values) if value is not None}
+
+    def set_many(self, mapping: dict[str, Any], expire_seconds: int = 300) -> None:
+        if any(not isinstance(key, str) or not key or key.isspace() for key in mapping):
+            raise ValueError("键必须为非空字符串")
+        if not isinstance(expire_seconds, int) or expire_seconds <= 0:
+            raise ValueError("过期时间必须为正整数（秒）")
+        if not mapping:
+            return
+        try:
+            # 非事务管道：多条 SET 合并为一次往返发送
+            pipe = self._client.pipeline(transaction=False)
+            for key, value in mapping.items():
+                pipe.set(key, value, ex=expire_seconds)
+            pipe.execute()
+        except RedisError as e:
+            raise RuntimeError(f"Redis 批量设置缓存失败：{e}")
+
+    def pipeline(self, transaction: bool = False):
+        """
+        返回底层客户端的管道，用于将多条任意命令合并为一次往返。
+
+        默认 transaction=False，不包裹 MULTI/EXEC，吞吐更高；需要原子执行时传 True。
+
+        使用示例：
+            with cache.pipeline() as pipe:
+                pipe.get("session:1")
+                pipe.incr("hits:1")
+                pipe.expire("session:1", 300)
+                session, hits, _ = pipe.execute()
+        """
+        return self._client.pipeline(transaction=transaction)
+
+
+class AsyncRedisCache:
+    """
+    基于 redis.asyncio 的异步 Redis 缓存，供 FastAPI 请求处理等异步代码使用。
+
+    接口与 RedisCache 一致，但方法均为协程：等待 Redis 响应期间让出事件循环，
+    不会阻塞同一进程中的其他请求。命令行工具、定时任务等同步代码仍使用 RedisCache。
+    连接池绑定在首次使用它的事件循环上，应在应用的事件循环内创建和使用。
+    """
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 6379,
+        db: int = 0,
+        password: str | None = None,
+        max_connections: int = 10,
+        pool_timeout: float = 5,
+        decode_responses: bool = False,
+        socket_keepalive: bool = True,
+        health_check_interval: int = 30,
+    ):
+        """参数含义同 RedisCache。"""
+        self._pool = redis.asyncio.BlockingConnectionPool(
+            host=host,
+            port=port,
+            db=db,
+            password=password,
+            max_connections=max_connections,
+            timeout=pool_timeout,
+            decode_responses=decode_responses,
+            socket_keepalive=socket_keepalive,
+            health_check_interval=health_check_interval,
+        )
+        self._client = redis.asyncio.Redis(connection_pool=self._pool)
+
+    async def get(self, key: str) -> Any | None:
+        if not key:
+            return None
+        try:
+            return await self._client.get(key)
+        except RedisError:
+            return None
+
+    async def set(self, key: str, value: Any, expire_seconds: int = 300) -> None:
+        if not isinstance(key, str) or not key or key.isspace():
+            raise ValueError("键必须为非空字符串")
+        if not isinstance(expire_seconds, int) or expire_seconds <= 0:
+            raise ValueError("过期时间必须为正整数（秒）")
+        try:
+            await self._client.set(key, value, ex=expire_seconds)
+        except RedisError as e:
+            raise RuntimeError(f"Redis 设置缓存失败（key: {key}）：{e}")
+
+    async def delete(self, key: str) -> bool:
+        if not key:
+            return False
+        try:
+            return await self._client.delete(key) == 1
+        except RedisError:
+            return False
+
+    async def exists(self, key: str) -> bool:
+        if not key:
+            return False
+        try:
+            return await self._client.exists(key) == 1
+        except RedisError:
+            return False
+
+    async def get_and_delete(self, key: str) -> Any | None:
+        if not key:
+            return None
+        try:
+            return await self._client.getdel(key)
+        except RedisError:
+            return None
+
+    async def get_many(self, keys: list[str]) -> dict[str, Any]:
+        keys = [key for key in keys if key]
+        if not keys:
+            return {}
+        try:
+            values = await self._client.mget(keys)
+        except RedisError:
+            return {}
+        return {key: value for key, value in zip(keys, values) if value is not None}
+
+    async def set_many(
+        self, mapping: dict[str, Any], expire_seconds: int = 300
+    ) -> None:
+        if any(not isinstance(key, str) or not key or key.isspace() for key in mapping):
+            raise ValueError("键必须为非空字符串")
+        if not isinstance(expire_seconds, int) or expire_seconds <= 0:
+            raise ValueError("过期时间必须为正整数（秒）")
+        if not mapping:
+            return
+        try:
+            pipe = self._client.pipeline(transaction=False)
+            for key, value in mapping.items():
+                pipe.set(key, value, ex=expire_seconds)
+            await pipe.execute()
+        except RedisError as e:
+            raise RuntimeError(f"Redis 批量设置缓存失败：{e}")
+
+    def pipeline(self, transaction: bool = False):
+        """
+        返回底层异步客户端的管道，用法同 RedisCache.pipeline，
+        区别是以 async with 使用并 await pipe.execute()。
+        """
+        return self._client.pipeline(transaction=transaction)
+
+    async def close(self) -> None:
+        """关闭客户端并断开连接池中的连接，在应用关闭时调用。"""
+        await self._client.aclose()
+        await self._pool.disconnect()
+
+
+class _CacheEntry:
+    """
+    内存缓存条目。使用 __slots__ 将字段内联在对象中，
+    相比列表/元组少一次内存分配，单条目占用更小。
+    """
+
+    __slots__ = ("expire_ts", "referenced", "size", "value")
+
+    def __init__(self, value: Any, expire_ts: float, size: int):
+        self.value = value
+        self.expire_ts = expire_ts
+        # 是否在保护区中被访问过（CLOCK 引用位）
+        self.referenced = False
+        self.size = size
+
+
+class _Packed(bytes):
+    """压缩存储的缓存值（pickle + zlib），用于与普通 bytes 值区分。"""
 
 
 class MemoryCache(CacheInterface):
-    """基于内存的缓存实现，支持 LRU 淘汰策略。"""
+    """
+    基于内存的缓存实现，使用分段 LRU（SLRU，近似 LRU-2）淘汰策略，可抵御批量扫描。
 
-    def __init__(self, max_size: int = 1000):
+    - 试用区（probation）：新写入的键先进入此区，按写入顺序淘汰
+    - 保护区（protected）：试用区的键再次被读取后晋升到此区，按 CLOCK（二次机会）淘汰
+
+    定时任务等一次性扫描写入的键只会停留在试用区，不会挤出保护区中的热点数据。
+    容量同时受条目数（max_size）与近似字节数（max_bytes）限制。
+    """
+
+    # 保护区占总容量的比例
+    PROTECTED_RATIO = 0.8
+    # 每写入多少次顺带清理一次过期条目（须为 2 的幂），以及每个分段单次检查的条目数
+    SWEEP_EVERY = 1024
+    SWEEP_WINDOW = 128
+
+    def __init__(
+        self,
+        max_size: int = 1000,
+        max_bytes: int | None = None,
+        low_watermark_ratio: float = 0.9,
+        compress: bool = False,
+    ):
         """
         初始化内存缓存。
 
-        :param max_size: 最大缓存数量，超过时触发 LRU 淘汰
+        :param max_size: 最大缓存数量，超过时触发淘汰
+        :param max_bytes: 缓存值占用的最大字节数（按 sys.getsizeof 估算），
+                          超过时触发淘汰；None 表示不限制
+        :param low_watermark_ratio: 淘汰低水位比例，超出上限后一次性淘汰到
+                                    上限 × 该比例，以较少次数的批量淘汰分摊开销
+        :param compress: 是否压缩存储较大的值（pickle + zlib），以 CPU 换内存；
+                         开启后读取返回的是反序列化得到的新对象
         """
-        self._cache: Dict[str, Tuple[Any, float, float]] = {}
+        # 条目为 _CacheEntry；有序字典的头部为最先淘汰的位置
+        # expire_ts 基于 time.monotonic()，不受系统时间调整影响
+        self._probation: OrderedDict[str, _CacheEntry] = OrderedDict()
+        # 保护区读取只置位 referenced，不调整顺序，淘汰时再给被访问过的条目第二次机会
+        self._protected: OrderedDict[str, _CacheEntry] = OrderedDict()
         self._max_size = max_size
+        self._max_bytes = max_bytes
+        self._low_size = int(max_size * low_watermark_ratio)
+        self._low_bytes = (
+            int(max_bytes * low_watermark_ratio) if max_bytes is not None else None
+        )
+        self._protected_size = max(1, int(max_size * self.PROTECTED_RATIO))
+        self._compress = compress
+        self._total_bytes = 0
+        self._writes = 0
+        # 命中统计（无锁累加，为近似值）
+        self._hits = 0
+        self._misses = 0
         self._lock = threading.Lock()
+        _register_reaper(self)
+
+    def _pop_protected_victim(self):
+        """按 CLOCK 策略从保护区取出一个淘汰条目，需持有锁调用。"""
+        while True:
+            k, item = self._protected.popitem(last=False)
+            if not item.referenced:
+                return k, item
+            # 被访问过：清除引用位并移到尾部，给予第二次机会
+            item.referenced = False
+            self._protected[k] = item
+
+    def _evict_one(self) -> bool:
+        """淘汰一个条目（优先试用区，且不淘汰试用区尾部刚写入的键），需持有锁调用。"""
+        if len(self._probation) > 1:
+            _, item = self._probation.popitem(last=False)
+        elif self._protected:
+            _, item = self._pop_protected_victim()
+        else:
+            return False
+        self._total_bytes -= item.size
+        return True
+
+    def _sweep_expired(self, now: float) -> None:
+        """检查两个分段头部（最早淘汰的位置）的少量条目并移除已过期的，需持有锁调用。"""
+        for segment in (self._probation, self._protected):
+            expired = [
+                key
+                for key, item in itertools.islice(segment.items(), self.SWEEP_WINDOW)
+                if now > item.expire_ts
+            ]
+            for key in expired:
+                self._total_bytes -= segment.pop(key).size
+
+    def _remove(self, key: str) -> Optional["_CacheEntry"]:
+        """从两个分段中移除键并扣减字节数，需持有锁调用。"""
+        item = self._protected.pop(key, None) or self._probation.pop(key, None)
+        if item:
+            self._total_bytes -= item.size
+        return item
+
+    # 序列化后小于该字节数的值不压缩，压缩收益抵不过开销
+    COMPRESS_MIN_BYTES = 256
+
+    def _pack(self, value: Any) -> Any:
+        data = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        if len(data) < self.COMPRESS_MIN_BYTES:
+            return value
+        return _Packed(zlib.compress(data, 1))
 
-    def get(self, key: str) -> Optional[Any]:
-        with self._lock:
-            item = self._cache.get(key)
-            if not item:
-                return None
-            value, expire_ts, _ = item
-            if time.time() > expire_ts:
-                del self._cache[key]
+    @staticmethod
+    def _unpack(value: Any) -> Any:
+        if type(value) is _Packed:
+            return pickle.loads(zlib.decompress(value))
+        return value
+
+    def get(self, key: str) -> Any | None:
+        # 保护区命中路径不加锁：字典读取与属性赋值在 GIL 下均为原子操作
+        # 已过期的条目只视为未命中，由后台线程统一清理
+        item = self._protected.get(key)
+        if item:
+            if time.monotonic() > item.expire_ts:
+                self._misses += 1
                 return None
-            self._cache[key] = (value, expire_ts, time.time())
-            return value
+            item.referenced = True
+            self._hits += 1
+            return self._unpack(item.value) if self._compress else item.value
+
+        item = self._probation.get(key)
+        if not item or time.monotonic() > item.expire_ts:
+            self._misses += 1
+            return None
+        with self._lock:
+            # 第二次访问：从试用区晋升到保护区（先插入再删除，无锁读取不会漏读）
+            if self._probation.get(key) is item:
+                self._protected[key] = item
+                del self._probation[key]
+                if len(self._protected) > self._protected_size:
+                    # 保护区已满：CLOCK 选出的条目降级回试用区尾部
+                    k, victim = self._pop_protected_victim()
+                    self._probation[k] = victim
+        self._hits += 1
+        return self._unpack(item.value) if self._compress else item.value
 
     def set(self, key: str, value: Any, expire_seconds: int = 300) -> None:
-        if not isinstance(key, str) or not key.strip():
+        if not isinstance(key, str) or not key or key.isspace():
             raise ValueError("键必须为非空字符串")
         if not isinstance(expire_seconds, int) or expire_seconds <= 0:
             raise ValueError("过期时间必须为正整数（秒）")
 
+        if self._compress:
+            value = self._pack(value)
+        size = sys.getsizeof(value)
+        if self._max_bytes is not None and size > self._max_bytes:
+            # 单个值超过字节上限时不缓存，否则会淘汰其他全部条目后仍超限；
+            # 同时移除该键的旧值，避免之后读到过期数据
+            with self._lock:
+                self._remove(key)
+            return
+        # 读取一次时钟并在加锁前算好过期时间，缩短临界区
+        now = time.monotonic()
+        expire_ts = now + expire_seconds
         with self._lock:
-            expire_ts = time.time() + expire_seconds
-            self._cache[key] = (value, expire_ts, time.time())
-
-            if len(self._cache) > self._max_size:
-                sorted_keys = sorted(
-                    self._cache.keys(), key=lambda k: self._cache[k][2]
-                )
-                evict_count = (
-                    len(self._cache) - self._max_size + int(self._max_size * 0.1)
-                )
-                for k in sorted_keys[:evict_count]:
-                    del self._cache[k]
-
-    def delete(self, key: str) -> None:
+            item = self._protected.get(key)
+            if item:
+                # 已在保护区的键原地更新，保持其所在分段
+                self._total_bytes += size - item.size
+                item.value, item.expire_ts, item.size = value, expire_ts, size
+            else:
+                old = self._probation.pop(key, None)
+                if old:
+                    self._total_bytes -= old.size
+                self._probation[key] = _CacheEntry(value, expire_ts, size)
+                self._total_bytes += size
+
+            # 写入密集时不必等待后台清理线程：每隔固定次数写入顺带清理少量过期条目
+            self._writes += 1
+            if not self._writes & (self.SWEEP_EVERY - 1):
+                self._sweep_expired(now)
+
+            # 超出上限时批量淘汰到低水位，避免每次写入都触发淘汰
+            count = len(self._probation) + len(self._protected)
+            if count > self._max_size:
+                for _ in range(count - self._low_size):
+                    if not self._evict_one():
+                        break
+            if self._max_bytes is not None and self._total_bytes > self._max_bytes:
+                while self._total_bytes > self._low_bytes and self._evict_one():
+                    pass
+
+    def delete(self, key: str) -> bool:
+        if not isinstance(key, str):
+            return False
         with self._lock:
-            if isinstance(key, str) and key in self._cache:
-                del self._cache[key]
+            return self._remove(key) is not None
 
     def exists(self, key: str) -> bool:
+        item = self._protected.get(key) or self._probation.get(key)
+        return bool(item) and time.monotonic() <= item.expire_ts
+
+    def get_and_delete(self, key: str) -> Any | None:
         with self._lock:
-            item = self._cache.get(key)
-            if not item:
-                return False
-            _, expire_ts, _ = item
-            if time.time() > expire_ts:
-                del self._cache[key]
-                return False
-            return True
+            item = self._remove(key)
+        # 过期判断无需持有锁
+        if not item or time.monotonic() > item.expire_ts:
+            return None
+        return self._unpack(item.value) if self._compress else item.value
+
+    def get_many(self, keys: list[str]) -> dict[str, Any]:
+        result = {}
+        for key in keys:
+            value = self.get(key)
+            if value is not None:
+                result[key] = value
+        return result
+
+    def set_many(self, mapping: dict[str, Any], expire_seconds: int = 300) -> None:
+        for key, value in mapping.items():
+            self.set(key, value, expire_seconds)
+
+    def purge_expired(self) -> int:
+        """
+        批量移除已过期的条目，由后台清理线程定期调用。
+
+        :return: 移除的条目数
+        """
+        now = time.monotonic()
+        with self._lock:
+            expired = [
+                key
+                for segment in (self._protected, self._probation)
+                for key, item in segment.items()
+                if now > item.expire_ts
+            ]
+            for key in expired:
+                self._remove(key)
+        return len(expired)
+
+    def stats(self) -> dict[str, Any]:
+        """
+        返回缓存统计信息。
+
+        :return: 条目数、估算字节数、命中/未命中次数与命中率
+        """
+        lookups = self._hits + self._misses
+        return {
+            "size": len(self._probation) + len(self._protected),
+            "bytes": self._total_bytes,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_ratio": self._hits / lookups if lookups else 0.0,
+        }
 
 
 class FileCache(CacheInterface):
-    """基于文件的简单缓存实现，使用 pickle 序列化存储每个键。"""
+    """
+    基于文件的简单缓存实现，每个键一个文件。
+
+    文件格式：8 字节过期时间戳（小端 float64）+ 1 字节值类型标记 + 值数据。
+    str/bytes 直接写入原始字节，其他类型使用 pickle 序列化；
+    读取时先解析定长头部，已过期则无需读取和反序列化值数据；
+    文件修改时间被设置为过期时间，exists 只需一次 stat。
+    """
+
+    # 文件头：过期时间戳 + 值类型标记
+    _HEADER = struct.Struct("<dc")
+    _TYPE_STR = b"s"
+    _TYPE_BYTES = b"b"
+    _TYPE_PICKLE = b"p"
 
     def __init__(self, cache_dir: str):
         self.cache_dir = cache_dir
         os.makedirs(self.cache_dir, exist_ok=True)
+        _register_reaper(self)
 
-    def _get_path(self, key: str) -> str:
-        return os.path.join(self.cache_dir, f"{key}.cache")
+    def _get_path(self, key: str, create_dir: bool = False) -> str:
+        """
+        键对应的缓存文件路径：文件名为键的 BLAKE2s 摘要，按摘要前两位分散到 256 个子目录，
+        避免单目录文件过多导致查找变慢，也避免键中的特殊字符影响路径。
 
-    def get(self, key: str) -> Optional[Any]:
-        if not key:
+        :param create_dir: 是否确保子目录存在（写入时使用）
+        """
+        digest = hashlib.blake2s(key.encode(), digest_size=8).hexdigest()
+        directory = os.path.join(self.cache_dir, digest[:2])
+        if create_dir:
+            os.makedirs(directory, exist_ok=True)
+        return os.path.join(directory, f"{digest}.cache")
+
+    @classmethod
+    def _dump_value(cls, value: Any) -> tuple[bytes, bytes]:
+        """将值编码为 (类型标记, 数据)。"""
+        if isinstance(value, str):
+            return cls._TYPE_STR, value.encode()
+        if isinstance(value, bytes):
+            return cls._TYPE_BYTES, value
+        return cls._TYPE_PICKLE, pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def _load_value(cls, value_type: bytes, data: bytes) -> Any:
+        """按类型标记解码值数据。"""
+        if value_type == cls._TYPE_STR:
+            return data.decode()
+        if value_type == cls._TYPE_BYTES:
+            return data
+        return pickle.loads(data)
+
+    def get(self, key: str) -> Any | None:
+        if not isinstance(key, str) or not key:
             return None
         path = self._get_path(key)
-        if not os.path.exists(path):
-            return None
         try:
             with open(path, "rb") as f:
-                expire_time, value = pickle.load(f)
-            if expire_time is not None and time.time() > expire_time:
-                try:
-                    os.remove(path)
-                except Exception:
-                    pass
-                return None
-            return value
+                expire_time, value_type = self._HEADER.unpack(f.read(self._HEADER.size))
+                # 已过期的文件由后台线程统一删除，读取路径不做 unlink
+                if time.time() > expire_time:
+                    return None
+                return self._load_value(value_type, f.read())
         except Exception:
             return None
 
     def set(self, key: str, value: Any, expire_seconds: int = 300) -> None:
-        if not key or not isinstance(expire_seconds, int) or expire_seconds <= 0:
+        # 键类型先于 _get_path 校验，非字符串键与其他后端一样抛出 ValueError
+        if (
+            not isinstance(key, str)
+            or not key
+            or not isinstance(expire_seconds, int)
+            or expire_seconds <= 0
+        ):
             raise ValueError("key不能为空，expire_seconds必须为正整数")
-        path = self._get_path(key)
+        path = self._get_path(key, create_dir=True)
         expire_time = time.time() + expire_seconds
         try:
+            value_type, data = self._dump_value(value)
             with open(path, "wb") as f:
-                pickle.dump((expire_time, value), f)
+                f.write(self._HEADER.pack(expire_time, value_type))
+                f.write(data)
+            # 文件修改时间同时记录过期时间，exists 只需 stat 而无需打开文件
+            os.utime(path, (expire_time, expire_time))
         except Exception as e:
             raise RuntimeError(f"写入缓存失败: {e}")
 
-    def delete(self, key: str) -> None:
-        if not key:
-            return
-        path = self._get_path(key)
+    def delete(self, key: str) -> bool:
+        if not isinstance(key, str) or not key:
+            return False
         try:
-            if os.path.exists(path):
-                os.remove(path)
-        except Exception:
-            pass
+            # unlink 是原子的，并发删除同一文件时仅一个调用成功
+            os.remove(self._get_path(key))
+        except OSError:
+            return False
+        return True
 
     def exists(self, key: str) -> bool:
-        if not key:
+        if not isinstance(key, str) or not key:
             return False
         path = self._get_path(key)
-        if not os.path.exists(path):
-            return False
         try:
-            with open(path, "rb") as f:
-                expire_time, _ = pickle.load(f)
-            if expire_time is not None and time.time() > expire_time:
-                try:
-                    os.remove(path)
-                except Exception:
-                    pass
-                return False
-            return True
-        except Exception:
+            # 文件修改时间即过期时间，无需打开文件
+            expire_time = os.stat(path).st_mtime
+        except OSError:
             return False
+        return time.time() <= expire_time
+
+    def get_and_delete(self, key: str) -> Any | None:
+        value = self.get(key)
+        # 仅删除成功的调用返回值，并发读取同一键时只有一个调用拿到
+        return value if self.delete(key) else None
+
+    def get_many(self, keys: list[str]) -> dict[str, Any]:
+        result = {}
+        for key in keys:
+            value = self.get(key)
+            if value is not None:
+                result[key] = value
+        return result
+
+    def set_many(self, mapping: dict[str, Any], expire_seconds: int = 300) -> None:
+        for key, value in mapping.items():
+            self.set(key, value, expire_seconds)
+
+    def purge_expired(self) -> int:
+        """
+        删除已过期的缓存文件（文件修改时间即过期时间），由后台清理线程定期调用。
+
+        :return: 删除的文件数
+        """
+        now = time.time()
+        removed = 0
+        # 只匹配 _get_path 生成的分片目录与缓存文件，cache_dir 与其他数据共用目录时不会误删
+        for path in glob.iglob(
+            os.path.join(glob.escape(self.cache_dir), "[0-9a-f][0-9a-f]", "*.cache")
+        ):
+            try:
+                if os.stat(path).st_mtime < now:
+                    os.remove(path)
+                    removed += 1
+            except OSError:
+                pass
+        return removed
 
 
 class CacheFactory:
@@ -287,43 +831,167 @@ class CacheFactory:
             "db": 0,
             "password": None,
             "max_connections": 10,
+            "pool_timeout": 5,
             "decode_responses": False,
+            "socket_keepalive": True,
+            "health_check_interval": 30,
+        },
+        SUPPORTED_CACHE_TYPE_MEMORY: {
+            "max_size": 1000,
+            "max_bytes": None,
+            "low_watermark_ratio": 0.9,
+            "compress": False,
         },
-        SUPPORTED_CACHE_TYPE_MEMORY: {"max_size": 1000},
         SUPPORTED_CACHE_TYPE_FILE: {"path": "storage/cache"},
     }
 
     @staticmethod
     def create_cache(user_config: dict = None) -> CacheInterface:
         """创建缓存实例，支持配置覆盖和默认值填充。"""
-        config = CacheFactory.DEFAULT_CONFIG.copy()
-        if user_config:
-            config = array_deep_merge(config, user_config)
+        defaults = CacheFactory.DEFAULT_CONFIG
+        user_config = user_config or {}
 
-        current_type = config.get("type")
+        current_type = user_config.get("type", defaults["type"])
         if current_type not in CacheFactory.SUPPORTED_CACHE_TYPES:
             raise ValueError(
                 f"不支持的缓存类型：{current_type}，仅支持 {CacheFactory.SUPPORTED_CACHE_TYPES}"
             )
 
+        # 配置只有两层且各类型的键固定，只需合并当前类型的子配置，无需通用的递归合并
+        type_config = {**defaults[current_type], **user_config.get(current_type, {})}
         if current_type == CacheFactory.SUPPORTED_CACHE_TYPE_REDIS:
             return RedisCache(
-                host=config.get("redis", {}).get("host"),
-                port=config.get("redis", {}).get("port"),
-                db=config.get("redis", {}).get("db"),
-                password=config.get("redis", {}).get("password"),
-                max_connections=config.get("redis", {}).get("max_connections"),
-                decode_responses=config.get("redis", {}).get("decode_responses"),
+                host=type_config.get("host"),
+                port=type_config.get("port"),
+                db=type_config.get("db"),
+                password=type_config.get("password"),
+                max_connections=type_config.get("max_connections"),
+                pool_timeout=type_config.get("pool_timeout"),
+                decode_responses=type_config.get("decode_responses"),
+                socket_keepalive=type_config.get("socket_keepalive"),
+                health_check_interval=type_config.get("health_check_interval"),
             )
         elif current_type == CacheFactory.SUPPORTED_CACHE_TYPE_MEMORY:
-            return MemoryCache(max_size=config.get("memory", {}).get("max_size"))
+            return MemoryCache(
+                max_size=type_config.get("max_size"),
+                max_bytes=type_config.get("max_bytes"),
+                low_watermark_ratio=type_config.get("low_watermark_ratio"),
+                compress=type_config.get("compress"),
+            )
         elif current_type == CacheFactory.SUPPORTED_CACHE_TYPE_FILE:
-            return FileCache(cache_dir=config.get("file", {}).get("path"))
+            return FileCache(cache_dir=type_config.get("path"))
+
+
+# 默认缓存实例：首次使用时才创建，仅导入本模块的工具/进程不会建立 Redis 连接池等资源
+_default_cache: CacheInterface | None = None
+_default_cache_lock = threading.Lock()
+
+
+def get_default_cache() -> CacheInterface:
+    """
+    获取按 setting.CACHE_CFG 创建的默认缓存实例。
+    配置只合并一次，之后的调用直接返回同一实例，无需重复调用 CacheFactory.create_cache。
+    """
+    global _default_cache
+    if _default_cache is None:
+        with _default_cache_lock:
+            if _default_cache is None:
+                _default_cache = CacheFactory.create_cache(setting.CACHE_CFG)
+    return _default_cache
+
+
+def get(key: str) -> Any | None:
+    return get_default_cache().get(key)
+
+
+def set(key: str, value: Any, expire_seconds: int = 300) -> None:
+    get_default_cache().set(key, value, expire_seconds)
+
+
+def delete(key: str) -> bool:
+    return get_default_cache().delete(key)
+
+
+def exists(key: str) -> bool:
+    return get_default_cache().exists(key)
+
+
+def get_and_delete(key: str) -> Any | None:
+    return get_default_cache().get_and_delete(key)
+
+
+def get_many(keys: list[str]) -> dict[str, Any]:
+    return get_default_cache().get_many(keys)
+
+
+def set_many(mapping: dict[str, Any], expire_seconds: int = 300) -> None:
+    get_default_cache().set_many(mapping, expire_seconds)
+
+
+# 默认异步 Redis 缓存实例：与 get_default_cache 相同，首次使用时才创建
+_default_async_redis: AsyncRedisCache | None = None
+
+
+def get_async_redis_cache() -> AsyncRedisCache:
+    """
+    获取按 setting.CACHE_CFG 中 redis 配置创建的异步 Redis 缓存实例，
+    与 cache.type 无关。需在事件循环中使用，事件循环是单线程的，无需加锁。
+    """
+    global _default_async_redis
+    if _default_async_redis is None:
+        config = {
+            **CacheFactory.DEFAULT_CONFIG[CacheFactory.SUPPORTED_CACHE_TYPE_REDIS],
+            **setting.CACHE_CFG.get(CacheFactory.SUPPORTED_CACHE_TYPE_REDIS, {}),
+        }
+        _default_async_redis = AsyncRedisCache(**config)
+    return _default_async_redis
+
+
+async def close_async_redis_cache() -> None:
+    """关闭默认异步 Redis 缓存实例（若已创建），在应用生命周期结束时调用。"""
+    global _default_async_redis
+    if _default_async_redis is not None:
+        cache, _default_async_redis = _default_async_redis, None
+        await cache.close()
+
+
+# -----------------------------
+# 异步接口（供 async def 请求处理函数使用）
+# -----------------------------
+# 默认缓存为 redis 时走 redis.asyncio 客户端，等待网络期间让出事件循环；
+# 为 file 时放到线程中执行，避免磁盘 I/O 阻塞事件循环；为 memory 时直接调用（纯内存操作）
+async def _call_default(method: str, *args) -> Any:
+    if setting.CACHE_CFG.get("type") == CacheFactory.SUPPORTED_CACHE_TYPE_REDIS:
+        return await getattr(get_async_redis_cache(), method)(*args)
+    cache = get_default_cache()
+    if isinstance(cache, FileCache):
+        return await asyncio.to_thread(getattr(cache, method), *args)
+    return getattr(cache, method)(*args)
+
+
+async def aget(key: str) -> Any | None:
+    return await _call_default("get", key)
+
+
+async def aset(key: str, value: Any, expire_seconds: int = 300) -> None:
+    await _call_default("set", key, value, expire_seconds)
+
+
+async def adelete(key: str) -> bool:
+    return await _call_default("delete", key)
+
+
+async def aexists(key: str) -> bool:
+    return await _call_default("exists", key)
+
+
+async def aget_and_delete(key: str) -> Any | None:
+    return await _call_default("get_and_delete", key)
+
+
+async def aget_many(keys: list[str]) -> dict[str, Any]:
+    return await _call_default("get_many", keys)
 
 
-# 默认缓存实例
-_default_cache = CacheFactory.create_cache(setting.CACHE_CFG)
-get = _default_cache.get
-set = _default_cache.set
-delete = _default_cache.delete
-exists = _default_cache.exists
+async def aset_many(mapping: dict[str, Any], expire_seconds: int = 300) -> None:
+    await _call_default("set_many", mapping, expire_seconds)
@@ -1,23 +1,57 @@
+import base64
 import datetime
-from typing import Any, Optional, Union
+import hashlib
+import hmac
+import time
+from typing import Any
 
+import bcrypt
 import jwt
-from passlib.context import CryptContext
+import orjson
 
 from config import setting
 
 # -----------------------------
-# 密码加密上下文
+# 密码哈希配置
 # -----------------------------
-# 使用 bcrypt 算法进行哈希
-# deprecated="auto" 表示自动弃用旧算法，推荐新算法
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# 直接调用 bcrypt 库（C 实现），不经过 passlib 的算法协商与弃用检查
+# 哈希格式与 passlib 生成的 $2b$ 哈希兼容，已有密码无需迁移
+BCRYPT_ROUNDS = setting.BCRYPT_ROUNDS
+# bcrypt 哈希的前缀标识，校验时据此直接分派到 bcrypt.checkpw
+_BCRYPT_PREFIXES = (b"$2a$", b"$2b$", b"$2y$")
 
 # -----------------------------
 # JWT 核心配置
 # -----------------------------
 SECRET_KEY = setting.SECRET_KEY
 ALGORITHM = "HS256"
+# HS256 签名密钥的字节形式，避免每次签名/验签时重复编码
+_SECRET_KEY_BYTES = SECRET_KEY.encode()
+# 已吸收密钥的 HMAC 状态（ipad/opad 两个块已完成压缩），每次签名复制后再写入消息，
+# 省去每个 token 两次密钥填充块的 SHA-256 压缩
+_HMAC_STATE = hmac.new(_SECRET_KEY_BYTES, digestmod=hashlib.sha256)
+
+
+def _b64url_encode(data: bytes) -> bytes:
+    """JWT 使用的 base64url 编码（去除末尾填充符）"""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _sign(msg: bytes) -> bytes:
+    """计算 HMAC-SHA256 签名，复用预先吸收密钥的 HMAC 状态"""
+    h = _HMAC_STATE.copy()
+    h.update(msg)
+    return h.digest()
+
+
+def _b64url_decode(data: str) -> bytes:
+    """JWT 使用的 base64url 解码（补齐末尾填充符）"""
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+# JWT 头部固定不变，模块加载时编码一次
+_HEADER_B64 = _b64url_encode(orjson.dumps({"alg": ALGORITHM, "typ": "JWT"}))
+_HEADER_B64_STR = _HEADER_B64.decode()
 
 
 def hash_verify(plain_password: str, hashed_password: str) -> bool:
@@ -28,7 +62,13 @@ def hash_verify(plain_password: str, hashed_password: str) -> bool:
     :param hashed_password: 数据库中存储的哈希密码
     :return: True 如果匹配，否则 False
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    if isinstance(hashed_password, str):
+        hashed_password = hashed_password.encode()
+    # 非 bcrypt 格式的哈希（如空值或其他算法）直接判定为不匹配，
+    # 避免进入 C 扩展后再以 ValueError 抛出
+    if not hashed_password.startswith(_BCRYPT_PREFIXES):
+        return False
+    return bcrypt.checkpw(plain_password.encode(), hashed_password)
 
 
 def hash_make(password: str) -> str:
@@ -38,14 +78,16 @@ def hash_make(password: str) -> str:
     :param password: 用户输入的明文密码
     :return: 加密后的哈希密码字符串
     """
-    return pwd_context.hash(password)
+    return bcrypt.hashpw(
+        password.encode(), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
+    ).decode()
 
 
 # -----------------------------
 # 生成 JWT Token
 # -----------------------------
 def jwt_encode(
-    subject: Union[str, Any], expires_delta: datetime.timedelta = datetime.timedelta(0)
+    subject: str | Any, expires_delta: datetime.timedelta = datetime.timedelta(0)
 ) -> str:
     """
     生成JSON Web Token (JWT)
@@ -69,18 +111,23 @@ def jwt_encode(
         # 生成30分钟后过期的令牌
         temporary_token = jwt_encode("user_1001", datetime.timedelta(minutes=30))
     """
-    to_encode = {"sub": str(subject)}
+    to_encode = {"sub": subject if type(subject) is str else str(subject)}
 
-    if expires_delta is not None and expires_delta.total_seconds() > 0:
-        expire = datetime.datetime.now() + expires_delta
-        to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    if expires_delta is not None:
+        seconds = expires_delta.total_seconds()
+        if seconds > 0:
+            # exp 为 Unix 时间戳，直接由 time.time() 计算，无需构造带时区的 datetime
+            to_encode["exp"] = int(time.time() + seconds)
+    # 直接拼接 header.payload 并用 HMAC-SHA256 签名，跳过 PyJWT 的通用编码流程
+    signing_input = _HEADER_B64 + b"." + _b64url_encode(orjson.dumps(to_encode))
+    signature = _sign(signing_input)
+    return (signing_input + b"." + _b64url_encode(signature)).decode()
 
 
 # -----------------------------
 # 解析 JWT Token
 # -----------------------------
-def jwt_decode(token: str) -> Optional[Union[str, Any]]:
+def jwt_decode(token: str) -> str | Any | None:
     """
     解析JWT令牌，提取负载数据
 
@@ -102,7 +149,7 @@ def jwt_decode(token: str) -> Optional[Union[str, Any]]:
             - 签名验证失败（密钥不匹配或令牌被篡改）
             - 令牌格式错误（不符合JWT规范格式）
             - 算法不匹配（使用的解密算法与签名算法不一致）
-            - 缺少必要的负载字段（如签名验证所需的字段缺失）
+            - 缺少必要的负载字段（如 sub 缺失）
             - 令牌已被吊销（如果系统实现了吊销机制）
             - 无效的时间戳格式（如exp、nbf等时间字段格式错误）
 
@@ -115,4 +162,73 @@ def jwt_decode(token: str) -> Optional[Union[str, Any]]:
         except jwt.InvalidTokenError:
             # 处理无效令牌逻辑
     """
-    return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    return _decode(token)
+
+
+def jwt_decode_subject(token: str) -> tuple[str, int | None]:
+    """
+    解析JWT令牌，仅返回认证所需的声明
+
+    功能描述：
+        与 jwt_decode 相同地验证签名与过期时间，但只取出 sub 与 exp，
+        调用方无需再持有和查询完整的负载字典。
+
+    参数说明：
+        token: 需要解析的JWT字符串
+
+    返回值：
+        (sub, exp) 元组；exp 为过期时间戳，永不过期的令牌为 None
+
+    异常说明：
+        同 jwt_decode
+    """
+    payload = _decode(token)
+    return payload["sub"], payload.get("exp")
+
+
+def _decode(token: str) -> dict:
+    """
+    校验 HS256 签名与 exp 并返回负载。
+    直接以 hmac + hashlib 验签，跳过 PyJWT 的算法注册表查找与选项合并；
+    异常沿用 PyJWT 的异常类型，调用方的异常处理保持不变。
+    """
+    try:
+        signing_input, _, signature_b64 = token.rpartition(".")
+        header_b64, _, body_b64 = signing_input.partition(".")
+        if not header_b64 or not body_b64 or "." in body_b64:
+            raise jwt.DecodeError("Not enough segments")
+        # 本服务签发的 token 头部与预编码的头部逐字节相同，只有不同时才解析头部 JSON
+        if header_b64 != _HEADER_B64_STR:
+            header = orjson.loads(_b64url_decode(header_b64))
+            if not isinstance(header, dict) or header.get("alg") != ALGORITHM:
+                raise jwt.InvalidAlgorithmError(
+                    "The specified alg value is not allowed"
+                )
+        signature = _b64url_decode(signature_b64)
+    except (AttributeError, ValueError, TypeError) as e:
+        raise jwt.DecodeError(f"Invalid token: {e}") from e
+
+    # 签名输入直接取自原 token 的前两段，无需重新拼接
+    expected = _sign(signing_input.encode())
+    if not hmac.compare_digest(signature, expected):
+        raise jwt.InvalidSignatureError("Signature verification failed")
+
+    # 验签通过后才解析负载，负载只做一次 base64 + JSON 解析
+    try:
+        payload = orjson.loads(_b64url_decode(body_b64))
+    except ValueError as e:
+        raise jwt.DecodeError(f"Invalid payload: {e}") from e
+    if not isinstance(payload, dict):
+        raise jwt.DecodeError("Invalid payload string: must be a json object")
+    if "sub" not in payload:
+        raise jwt.MissingRequiredClaimError("sub")
+    if not isinstance(payload["sub"], str):
+        # 与 PyJWT 一致，sub 必须为字符串
+        raise jwt.exceptions.InvalidSubjectError("Subject must be a string")
+    exp = payload.get("exp")
+    if exp is not None:
+        if not isinstance(exp, (int, float)) or isinstance(exp, bool):
+            raise jwt.DecodeError("Expiration Time claim (exp) must be an integer.")
+        if exp <= time.time():
+            raise jwt.ExpiredSignatureError("Signature has expired")
+    return payload
@@ -1,3 +1,4 @@
+from operator import methodcaller
 from typing import Any, Callable, Iterable, Optional, Union
 
 
@@ -20,18 +21,21 @@ def array_deep_merge(*dicts):
     {'a': 2, 'b': {'x': 1, 'y': 2}}
     """
 
-    def _merge(d1, d2):
-        result = d1.copy()
-        for k, v in d2.items():
-            if k in result and isinstance(result[k], dict) and isinstance(v, dict):
-                result[k] = _merge(result[k], v)
+    def _merge_into(dst, src):
+        # 就地合并到累加结果中；字典值复制一层后再放入，后续合并不会修改调用方传入的字典
+        for k, v in src.items():
+            if isinstance(v, dict):
+                target = dst.get(k)
+                if not isinstance(target, dict):
+                    target = dst[k] = {}
+                _merge_into(target, v)
             else:
-                result[k] = v
-        return result
+                dst[k] = v
+        return dst
 
     merged = {}
     for d in dicts:
-        merged = _merge(merged, d)
+        _merge_into(merged, d)
     return merged
 
 
@@ -73,29 +77,22 @@ def array_index(
     {'123': [{'id': '123', 'data': 'abc'}],
      '345': [{'id': '345', 'data': 'def'}, {'id': '345', 'data': 'hgi'}]}
     """
-    result = {}
+    # 分组处理：元素按 group_key 字段归入列表，此时 key 不参与计算
+    if group_key:
+        get_group = methodcaller("get", group_key)
+        result = {}
+        for element in array:
+            result.setdefault(get_group(element), []).append(element)
+        return result
 
-    for element in array:
-        # 计算索引 key
-        if callable(key):
-            k = key(element)
-        elif isinstance(key, str):
-            k = element.get(key)
-        else:
-            k = None
-
-        # 分组处理
-        if group_key:
-            gk = element.get(group_key)
-            if gk is None:
-                result.setdefault(None, []).append(element)
-            else:
-                result.setdefault(gk, []).append(element)
-        else:
-            if k is not None:
-                result[k] = element
-
-    return result
+    # 取 key 的方式在循环外确定一次，循环内不再做类型判断
+    if callable(key):
+        get_key = key
+    elif isinstance(key, str):
+        get_key = methodcaller("get", key)
+    else:
+        return {}
+    return {k: element for element in array if (k := get_key(element)) is not None}
 
 
 def array_map(
@@ -135,21 +132,15 @@ def array_map(
     ...           group=lambda x: x['class'])
     {'x': {'123': 'AAA', '124': 'BBB'}, 'y': {'345': 'CCC'}}
     """
-    result = {}
+    # 取 key/value/group 的方式在循环外确定一次，循环内不再做类型判断
+    get_key = key if callable(key) else methodcaller("get", key)
+    get_value = value if callable(value) else methodcaller("get", value)
 
-    for element in array:
-        # 计算 key
-        k = key(element) if callable(key) else element.get(key)
-        # 计算 value
-        v = value(element) if callable(value) else element.get(value)
-
-        # 分组处理
-        if group:
-            gk = group(element) if callable(group) else element.get(group)
-            if gk not in result:
-                result[gk] = {}
-            result[gk][k] = v
-        else:
-            result[k] = v
+    if not group:
+        return {get_key(element): get_value(element) for element in array}
 
+    get_group = group if callable(group) else methodcaller("get", group)
+    result = {}
+    for element in array:
+        result.setdefault(get_group(element), {})[get_key(element)] = get_value(element)
     return result
@@ -1,8 +1,41 @@
+import functools
 import importlib
 import logging
 import pkgutil
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable, List
 
+from config import setting
+
+
+@functools.cache
+def _list_modules(package_name: str) -> tuple[tuple[str, bool], ...]:
+    """
+    列出包下的直接子模块，结果按包名缓存，同一包只遍历一次目录。
+
+    :param package_name: 包名
+    :return: (模块完整路径, 是否为子包) 元组
+    """
+    package = importlib.import_module(package_name)
+    return tuple(
+        (f"{package_name}.{module_name}", is_pkg)
+        for _, module_name, is_pkg in pkgutil.iter_modules(package.__path__)
+    )
+
+
+def _safe_import(module_path: str) -> str | None:
+    """
+    导入单个模块，失败时返回错误描述而不抛出异常。
+
+    :param module_path: 模块完整路径
+    :return: 成功返回 None，失败返回错误描述
+    """
+    try:
+        importlib.import_module(module_path)
+        return None
+    except Exception as e:
+        return f"{module_path} (错误: {type(e).__name__}: {e})"
+
 
 class loader:
     """
@@ -16,6 +49,8 @@ class loader:
     - 导入失败会记录到日志，而不会抛出异常
     """
 
+    __slots__ = ("include_subpackages", "max_workers", "package_name", "scan_prior")
+
     _scanned_packages = set()  # 类级缓存，用于避免重复导入同一包
 
     def __init__(
@@ -23,6 +58,7 @@ class loader:
         package_name: str,
         include_subpackages: bool = False,
         scan_prior: bool = False,
+        max_workers: int = setting.MODULE_IMPORT_WORKERS,
     ):
         """
         初始化装饰器参数
@@ -30,10 +66,12 @@ class loader:
         :param package_name: 要扫描的包名（如 "app.jobs"）
         :param include_subpackages: 是否递归扫描子包，默认为 False
         :param scan_prior: 扫描时机，True 表示在函数执行前扫描，False 表示在函数执行后扫描
+        :param max_workers: 并行导入模块的线程数，1 表示串行导入
         """
         self.package_name = package_name
         self.include_subpackages = include_subpackages
         self.scan_prior = scan_prior
+        self.max_workers = max_workers
 
     def __call__(self, func: Callable):
         """
@@ -75,18 +113,24 @@ class loader:
 
         if not failed_modules:
             logging.info(
-                f"✅ 成功导入 {self.package_name} 包下所有模块，共 {success_count} 个"
+                "✅ 成功导入 %s 包下所有模块，共 %d 个",
+                self.package_name,
+                success_count,
             )
         else:
             logging.warning(
-                f"⚠️ {self.package_name} 包模块导入完成 - "
-                f"成功: {success_count} 个, 失败: {len(failed_modules)} 个"
+                "⚠️ %s 包模块导入完成 - 成功: %d 个, 失败: %d 个\n%s",
+                self.package_name,
+                success_count,
+                len(failed_modules),
+                "\n".join(
+                    f"  失败项 {idx}: {error}"
+                    for idx, error in enumerate(failed_modules, 1)
+                ),
             )
-            for idx, error in enumerate(failed_modules, 1):
-                logging.warning(f"  失败项 {idx}: {error}")
 
         if success_count == 0 and not failed_modules:
-            logging.info(f"ℹ️ {self.package_name} 包下未发现任何可导入的模块")
+            logging.info("ℹ️ %s 包下未发现任何可导入的模块", self.package_name)
 
     def loader_pkg(
         self, package_name: str, include_subpackages: bool = False
@@ -103,31 +147,42 @@ class loader:
             return 0, []
 
         try:
-            # 导入根包
-            package = importlib.import_module(package_name)
+            # 导入根包并列出其子模块
+            module_paths = _list_modules(package_name)
             success_count = 0
             failed_modules: List[str] = []
 
-            # 遍历包下所有模块和子包
-            for _, module_name, is_pkg in pkgutil.iter_modules(package.__path__):
-                module_path = f"{package_name}.{module_name}"
-                try:
-                    if is_pkg and include_subpackages:
-                        # 递归扫描子包
-                        sub_success, sub_failed = self.loader_pkg(
-                            module_path, include_subpackages
-                        )
-                        success_count += sub_success
-                        failed_modules.extend(sub_failed)
-                    else:
-                        # 导入普通模块
-                        importlib.import_module(module_path)
-                        success_count += 1
-                except Exception as e:
-                    # 捕获导入异常，记录失败模块
-                    failed_modules.append(
-                        f"{module_path} (错误: {type(e).__name__}: {e})"
-                    )
+            # 需要递归扫描的子包与直接导入的模块分开处理
+            subpackages = [
+                path for path, is_pkg in module_paths if is_pkg and include_subpackages
+            ]
+            leaf_modules = [
+                path
+                for path, is_pkg in module_paths
+                if not (is_pkg and include_subpackages)
+            ]
+
+            # 导入普通模块：配置了多个线程时并行导入，重叠文件读取等 I/O 等待
+            if self.max_workers > 1 and len(leaf_modules) > 1:
+                with ThreadPoolExecutor(
+                    max_workers=min(self.max_workers, len(leaf_modules))
+                ) as executor:
+                    errors = list(executor.map(_safe_import, leaf_modules))
+            else:
+                errors = [_safe_import(path) for path in leaf_modules]
+            for error in errors:
+                if error is None:
+                    success_count += 1
+                else:
+                    failed_modules.append(error)
+
+            # 递归扫描子包
+            for module_path in subpackages:
+                sub_success, sub_failed = self.loader_pkg(
+                    module_path, include_subpackages
+                )
+                success_count += sub_success
+                failed_modules.extend(sub_failed)
 
             # 标记包已扫描
             self._scanned_packages.add(package_name)
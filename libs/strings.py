@@ -2,6 +2,13 @@ import random
 import string
 from typing import Literal
 
+# 随机源使用操作系统提供的密码学安全随机数（os.urandom），
+# random_string 用于生成邮箱验证码等需要不可预测的值，不能使用可被推算的 random 默认生成器
+_random = random.SystemRandom()
+
+# 常用汉字的 Unicode 码点范围（\u4e00-\u9fa5，含两端）
+_CJK_RANGE = range(0x4E00, 0x9FA6)
+
 
 def random_digits(length: int = 6) -> str:
     """
@@ -17,8 +24,8 @@ def random_digits(length: int = 6) -> str:
     """
     if length <= 0:
         raise ValueError("长度必须为正整数")
-    # 从string.digits（包含"0123456789"）中随机选择字符，重复length次并拼接
-    return "".join(random.choice(string.digits) for _ in range(length))
+    # 从string.digits（包含"0123456789"）中一次性随机选取length个字符并拼接
+    return "".join(_random.choices(string.digits, k=length))
 
 
 def random_letters(length: int = 6) -> str:
@@ -35,8 +42,8 @@ def random_letters(length: int = 6) -> str:
     """
     if length <= 0:
         raise ValueError("长度必须为正整数")
-    # 从string.ascii_letters（包含所有大小写字母）中随机选择字符，重复length次并拼接
-    return "".join(random.choice(string.ascii_letters) for _ in range(length))
+    # 从string.ascii_letters（包含所有大小写字母）中一次性随机选取length个字符并拼接
+    return "".join(_random.choices(string.ascii_letters, k=length))
 
 
 def random_chinese(length: int = 6) -> str:
@@ -55,8 +62,17 @@ def random_chinese(length: int = 6) -> str:
     """
     if length <= 0:
         raise ValueError("长度必须为正整数")
-    # 从Unicode常用汉字范围随机生成字符，重复length次并拼接
-    return "".join(chr(random.randint(0x4E00, 0x9FA5)) for _ in range(length))
+    # 从Unicode常用汉字码点范围一次性随机选取length个码点，转换为字符后拼接
+    return "".join(map(chr, _random.choices(_CJK_RANGE, k=length)))
+
+
+# 类型与生成函数的映射关系，模块加载时构建一次
+_TYPE_MAPPING = {
+    "digit": random_digits,
+    "letter": random_letters,
+    "chinese": random_chinese,
+}
+_TYPE_NAMES = list(_TYPE_MAPPING)
 
 
 def random_string(
@@ -83,18 +99,10 @@ def random_string(
         generate_random_str(4, 'letter') → 生成4位字母（如"AbCd"）
         generate_random_str(2, 'chinese') → 生成2个汉字（如"山水"）
     """
-    # 类型与生成函数的映射关系，修复拼写错误（random_ters→random_letters，random_nese→random_chinese）
-    type_mapping = {
-        "digit": random_digits,
-        "letter": random_letters,
-        "chinese": random_chinese,
-    }
-
+    generate = _TYPE_MAPPING.get(char_type)
     # 校验字符类型是否支持
-    if char_type not in type_mapping:
-        raise ValueError(
-            f"不支持的类型：{char_type}，可选类型：{list(type_mapping.keys())}"
-        )
+    if generate is None:
+        raise ValueError(f"不支持的类型：{char_type}，可选类型：{_TYPE_NAMES}")
 
     # 调用对应类型的生成函数并返回结果
-    return type_mapping[char_type](length)
+    return generate(length)
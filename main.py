@@ -1,5 +1,6 @@
 import uvicorn
 
+from app.support.fast import JSONSuccess
 from boot.application import create_app
 from boot.setup import logger
 
@@ -17,7 +18,7 @@ app = create_app()
 # 定义一个简单的 GET 请求路由，用于测试应用是否启动成功
 @app.get("/")
 def index():
-    return {"code": 200, "message": "welcome to fastapi skeleton"}
+    return JSONSuccess(message="welcome to fastapi skeleton")
 
 
 # 当该脚本直接执行时，使用 uvicorn 启动应用
@@ -1,6 +1,8 @@
 import asyncio
+import functools
 import logging
 import signal
+import sys
 from typing import Optional
 
 from boot.scheduler import create_app
@@ -18,7 +20,7 @@ app = create_app()
 async def shutdown(signal_name: Optional[str] = None):
     """优雅关闭调度器"""
     if signal_name:
-        logging.info(f"收到系统信号 {signal_name}，正在关闭调度器...")
+        logging.info("收到系统信号 %s，正在关闭调度器...", signal_name)
     else:
         logging.info("收到退出请求，正在关闭调度器...")
     try:
@@ -29,11 +31,28 @@ async def shutdown(signal_name: Optional[str] = None):
             app.shutdown(wait=True)
         logging.info("调度器已优雅关闭。")
     except Exception as e:
-        logging.error(f"关闭调度器时出错: {e}", exc_info=True)
+        logging.error("关闭调度器时出错: %s", e, exc_info=True)
     finally:
         logging.info("===== 调度器已完全退出 =====")
 
 
+def _on_signal(signal_name: str, stop: asyncio.Future) -> None:
+    """信号回调：只记录信号名并唤醒主协程，关闭流程由主协程执行"""
+    if not stop.done():
+        stop.set_result(signal_name)
+
+
+def _install_signal_handlers(
+    loop: asyncio.AbstractEventLoop, stop: asyncio.Future
+) -> None:
+    """注册系统信号（Ctrl+C / SIGTERM），每次运行只调用一次"""
+    if sys.platform == "win32":
+        # Windows 事件循环不支持 add_signal_handler，Ctrl+C 由 KeyboardInterrupt 分支处理
+        return
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, functools.partial(_on_signal, sig.name, stop))
+
+
 async def main():
     """主异步函数：启动调度器并保持运行"""
     try:
@@ -43,21 +62,18 @@ async def main():
         else:
             app.start()
         logging.info("调度器启动成功，开始运行任务...")
-        # 注册系统信号（Ctrl+C / SIGTERM）
         loop = asyncio.get_running_loop()
-        for sig in (signal.SIGINT, signal.SIGTERM):
-            loop.add_signal_handler(
-                sig, lambda s=sig: asyncio.create_task(shutdown(s.name))
-            )
-        # 保持事件循环运行
-        await asyncio.Event().wait()
+        stop = loop.create_future()
+        _install_signal_handlers(loop, stop)
+        # 保持事件循环运行，直到收到退出信号后关闭调度器
+        await shutdown(await stop)
     except asyncio.CancelledError:
         pass
     except KeyboardInterrupt:
         logging.info("用户中断操作，正在关闭调度器...")
         await shutdown("KeyboardInterrupt")
     except Exception as e:
-        logging.error(f"调度器运行异常: {e}", exc_info=True)
+        logging.error("调度器运行异常: %s", e, exc_info=True)
         shutdown_method = app.shutdown
         if asyncio.iscoroutinefunction(shutdown_method):
             await app.shutdown(wait=False)
@@ -72,6 +88,6 @@ if __name__ == "__main__":
         logging.info("检测到 KeyboardInterrupt，程序退出。")
     except RuntimeError as e:
         if "Event loop is closed" not in str(e):
-            logging.critical(f"致命错误: {e}", exc_info=True)
+            logging.critical("致命错误: %s", e, exc_info=True)
     finally:
         logging.info("===== 调度器主程序退出 =====")
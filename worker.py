@@ -24,4 +24,4 @@ if __name__ == "__main__":
         logging.warning("接收到手动终止信号，Celery Worker正在停止")
     except Exception as e:
         # 捕获所有未预期异常，打印详细日志后退出
-        logging.error(f"Celery Worker启动失败，异常信息：{str(e)}", exc_info=True)
+        logging.error("Celery Worker启动失败，异常信息：%s", e, exc_info=True)